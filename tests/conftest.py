@@ -5,36 +5,114 @@ including DPDK process management, control client connections, and TAP
 interface verification.
 """
 
+import errno
+import logging
+import os
 import pytest
-import json
-import time
+import re
+import subprocess
 import sys
 from pathlib import Path
+from typing import Optional
 
 # Add tests directory to Python path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from fixtures.config_generator import TestConfigGenerator
+from fixtures.config_generator import GeneratedConfig, TestConfigGenerator
 from fixtures.dpdk_process import DpdkProcess
 from fixtures.control_client import ControlClient
 from fixtures.tap_interface import TapInterfaceManager
 
+# Manual scripts that spawn processes at import time; never collect them
+collect_ignore = ["tools"]
+
+# Matches the iface=NAME devarg anywhere in a net_tap vdev spec
+_IFACE_RE = re.compile(r'(?:^|,)iface=([^,\s]+)')
+
+logger = logging.getLogger(__name__)
+
+
+# One getcap clause: capability list (empty or "all" for every capability)
+# followed by one or more operator/flags actions, e.g. "cap_net_raw,cap_net_admin=ep"
+_CAP_CLAUSE_RE = re.compile(r'([a-z0-9_,]*)((?:[=+-][eip]*)+)')
+_CAP_ACTION_RE = re.compile(r'([=+-])([eip]*)')
+
+
+def _grants_net_admin(getcap_output: str, binary: Path) -> bool:
+    """
+    Check whether getcap output gives the binary CAP_NET_ADMIN in the
+    effective and permitted sets.
+
+    Handles both formats: older libcap prints "= cap_net_admin+ep",
+    newer prints "cap_net_admin=ep"; either may list several
+    capabilities per clause and several clauses.
+    """
+    text = getcap_output.strip()
+    if text.startswith(str(binary)):
+        text = text[len(str(binary)):]
+    flags = set()
+    for clause in text.split():
+        match = _CAP_CLAUSE_RE.fullmatch(clause)
+        if match is None:
+            continue
+        caps = match.group(1).split(',') if match.group(1) else ['all']
+        if 'cap_net_admin' not in caps and 'all' not in caps:
+            continue
+        for op, op_flags in _CAP_ACTION_RE.findall(match.group(2)):
+            if op == '=':
+                flags = set(op_flags)
+            elif op == '+':
+                flags |= set(op_flags)
+            else:
+                flags -= set(op_flags)
+    return {'e', 'p'} <= flags
+
+
+def _getcap(binary: Path) -> str:
+    """getcap output for the binary ("" if getcap is not installed)."""
+    try:
+        result = subprocess.run(
+            ['getcap', str(binary)], capture_output=True, text=True
+        )
+    except FileNotFoundError:
+        return ""
+    return result.stdout
+
+
+def _capability_xattr(binary: Path) -> Optional[str]:
+    """
+    Hex of the binary's security.capability xattr, "" if it has none.
+
+    Returns None if the xattr cannot be read at all, in which case the
+    binary cannot be checked without getcap.
+    """
+    try:
+        return os.getxattr(binary, 'security.capability').hex()
+    except OSError as e:
+        return "" if e.errno == errno.ENODATA else None
+    except AttributeError:
+        return None  # No xattr support on this platform
+
 
 @pytest.fixture(scope="session")
 def binary_path():
     """
     Path to the DPDK main binary.
 
-    Automatically grants CAP_NET_ADMIN so TAP interfaces can be created
-    without running the entire test suite as root.
+    Requires CAP_NET_ADMIN on the binary so TAP interfaces can be created
+    without running the entire test suite as root. The capability is
+    granted once per build by tests/scripts/setup_caps.sh; this fixture
+    only verifies it and never calls sudo. A sentinel file next to the
+    binary records the mtime and security.capability xattr it was
+    verified with (plus the getcap output, for reference), so repeat
+    runs against an unchanged binary skip the getcap check as well;
+    rebuilding or `setcap -r` changes one of them.
 
     Returns:
         Path object pointing to the Bazel-built binary
 
     Scope: session (shared across all tests)
     """
-    import subprocess as _sp
-
     # Locate Bazel-built binary (relative to project root, not tests dir)
     project_root = Path(__file__).parent.parent
     binary = project_root / "bazel-bin" / "main"
@@ -42,100 +120,121 @@ def binary_path():
     if not binary.exists():
         pytest.skip(f"Binary not found: {binary}. Run 'bazel build //:main' first.")
 
-    # Grant CAP_NET_ADMIN so the binary can create TAP interfaces without root
-    try:
-        _sp.run(
-            ['sudo', 'setcap', 'cap_net_admin+ep', str(binary)],
-            check=True, capture_output=True, text=True
-        )
-    except _sp.CalledProcessError as e:
+    # Rebuilding the binary changes its mtime and drops file capabilities;
+    # `setcap -r` leaves the mtime alone but removes the xattr
+    sentinel = binary.with_suffix('.capset')
+    mtime = str(binary.stat().st_mtime_ns)
+    cap_xattr = _capability_xattr(binary)
+    if cap_xattr is not None:
+        try:
+            recorded = sentinel.read_text().split('\n', 2)
+            if recorded[:2] == [mtime, cap_xattr]:
+                return binary
+        except OSError:
+            pass  # No sentinel yet
+
+    getcap_output = _getcap(binary)
+    if not _grants_net_admin(getcap_output, binary):
         pytest.skip(
-            f"Failed to set CAP_NET_ADMIN on {binary}: {e.stderr.strip()}. "
-            "Run tests with sudo access or manually: "
-            f"sudo setcap cap_net_admin+ep {binary}"
+            f"{binary} lacks CAP_NET_ADMIN. "
+            "Run ./tests/scripts/setup_caps.sh once after building."
         )
 
+    if cap_xattr is not None:
+        try:
+            sentinel.write_text(f"{mtime}\n{cap_xattr}\n{getcap_output}")
+        except OSError:
+            pass  # Sentinel is only an optimization
+
     return binary
 
 
 @pytest.fixture(scope="session")
-def test_output_dir(tmp_path_factory):
+def test_output_dir(tmp_path_factory, request):
     """
     Directory for test outputs and artifacts.
     
+    Uses a fixed, un-numbered name inside the session's base temp dir
+    so its path is predictable; pytest.ini limits how many past
+    sessions are kept on disk. The path is also recorded on the session
+    for the failure-log hook (pytest_runtest_makereport).
+    
     Returns:
         Path object for temporary test directory
     
     Scope: session (shared across all tests)
     """
-    return tmp_path_factory.mktemp("dpdk_tests")
+    output_dir = tmp_path_factory.mktemp("dpdk_tests", numbered=False)
+    request.session.dpdk_output_dir = output_dir
+    return output_dir
 
 
-@pytest.fixture
+def _config_file_name(num_ports, num_threads, num_rx_queues, num_tx_queues,
+                      processor_name, processor_params, session_capacity):
+    """Stable config file name for a configuration shape."""
+    name = f"dpdk_test_{num_ports}p_{num_threads}t_{num_rx_queues}rx_{num_tx_queues}tx"
+    if processor_name is not None:
+        name += f"_{processor_name}"
+    if processor_params:
+        name += "".join(f"_{k}{v}" for k, v in processor_params)
+    if session_capacity > 0:
+        name += f"_s{session_capacity}"
+    return f"{name}.json"
+
+
+@pytest.fixture(scope="module")
 def test_config(test_output_dir, request):
     """
     Generate test configuration based on test parameters.
     
     This fixture automatically generates a dpdk.json configuration file
-    with net_tap virtual PMD based on test parameters. Tests can use
-    pytest.mark.parametrize to specify configuration parameters.
+    with net_tap virtual PMD. Without parameters it uses the default
+    shape; a module or class can pick another one by parametrizing
+    test_config indirectly with a dict of generate_config() arguments.
     
-    Parameters (from test markers):
+    Parameters (dict keys, all optional):
         num_threads: Number of PMD threads (default: 2)
         num_queues: Number of queues per port (default: 2)
         num_ports: Number of virtual ports (default: 2)
+        num_rx_queues, num_tx_queues: Override num_queues per direction
+        processor_name, processor_params, session_capacity: Processor setup
     
     Returns:
-        Path to generated configuration file
+        GeneratedConfig with the file path and the parsed configuration,
+        so dependent fixtures never need to re-read the file
     
     Usage:
-        @pytest.mark.parametrize("num_threads,num_queues", [(1,1), (2,2)])
-        def test_something(test_config):
-            # test_config is automatically generated with specified parameters
+        @pytest.mark.parametrize("test_config", [{"num_threads": 1}], indirect=True)
+        class TestSomething:
+            def test_something(self, test_config):
+                # test_config is generated with the given parameters
     
-    Scope: function (new config for each test)
+    Scope: module (one config per module and parameter set, so the
+    process fixtures built on it can be shared across a module's tests)
     """
-    # Extract parameters from test markers or use defaults
     params = getattr(request, 'param', {})
-    
-    # Support both dict params and individual markers
-    if isinstance(params, dict):
-        num_threads = params.get('num_threads', 2)
-        num_queues = params.get('num_queues', 2)
-        num_ports = params.get('num_ports', 2)
-        num_rx_queues = params.get('num_rx_queues', None)
-        num_tx_queues = params.get('num_tx_queues', None)
-        processor_name = params.get('processor_name', None)
-        processor_params = params.get('processor_params', None)
-        session_capacity = params.get('session_capacity', 0)
-    else:
-        # Try to get from test node markers
-        num_threads = 2
-        num_queues = 2
-        num_ports = 2
-        num_rx_queues = None
-        num_tx_queues = None
-        processor_name = None
-        processor_params = None
-        session_capacity = 0
-        
-        # Check for custom markers
-        for marker in request.node.iter_markers():
-            if marker.name == 'config':
-                num_threads = marker.kwargs.get('num_threads', num_threads)
-                num_queues = marker.kwargs.get('num_queues', num_queues)
-                num_ports = marker.kwargs.get('num_ports', num_ports)
-                num_rx_queues = marker.kwargs.get('num_rx_queues', num_rx_queues)
-                num_tx_queues = marker.kwargs.get('num_tx_queues', num_tx_queues)
-                processor_name = marker.kwargs.get('processor_name', processor_name)
-                processor_params = marker.kwargs.get('processor_params', processor_params)
-                session_capacity = marker.kwargs.get('session_capacity', session_capacity)
-    
-    # Generate configuration
+    num_threads = params.get('num_threads', 2)
+    num_queues = params.get('num_queues', 2)
+    num_ports = params.get('num_ports', 2)
+    num_rx_queues = params.get('num_rx_queues', None)
+    num_tx_queues = params.get('num_tx_queues', None)
+    processor_name = params.get('processor_name', None)
+    processor_params = params.get('processor_params', None)
+    session_capacity = params.get('session_capacity', 0)
+    
+    # Resolve queue defaults so equivalent shapes share a cache entry
+    if num_rx_queues is None:
+        num_rx_queues = num_queues
+    if num_tx_queues is None:
+        num_tx_queues = num_queues
+    params_key = tuple(sorted(processor_params.items())) if processor_params else None
+    key = (num_ports, num_threads, num_rx_queues, num_tx_queues,
+           processor_name, params_key, session_capacity)
+    
+    # One file per configuration shape; reuse it if already written this session
     config = TestConfigGenerator.generate_config(
         num_ports=num_ports,
         num_threads=num_threads,
-        num_queues=num_queues,
         num_rx_queues=num_rx_queues,
         num_tx_queues=num_tx_queues,
         use_hugepages=False,  # Always disable hugepages for testing
@@ -143,16 +242,15 @@ def test_config(test_output_dir, request):
         processor_params=processor_params,
         session_capacity=session_capacity
     )
+    config_path = test_output_dir / _config_file_name(*key)
+    if not config_path.exists():
+        TestConfigGenerator.write_config(config, str(config_path))
     
-    # Write to file with unique name
-    config_path = test_output_dir / f"dpdk_test_{request.node.name}.json"
-    TestConfigGenerator.write_config(config, str(config_path))
-    
-    return config_path
+    return GeneratedConfig(path=config_path, data=config)
 
 
-@pytest.fixture
-def dpdk_process(binary_path, test_config, test_output_dir, request):
+@pytest.fixture(scope="module")
+def dpdk_process(binary_path, test_config):
     """
     DPDK process fixture with automatic lifecycle management.
     
@@ -160,17 +258,20 @@ def dpdk_process(binary_path, test_config, test_output_dir, request):
     - Automatic process launch with test configuration
     - Startup verification (waits for "Control plane ready")
     - Output capture for diagnostics
-    - Automatic cleanup on test completion
-    - Log preservation on test failure
+    - Automatic cleanup once the module's tests are done
+    
+    Modules that share it opt into per-test relaunch with the
+    reset_dpdk_state fixture; logs of failed tests are saved by
+    pytest_runtest_makereport.
     
     Returns:
         DpdkProcess instance (already started and ready)
     
-    Scope: function (new process for each test)
+    Scope: module (one process shared by the tests of a module)
     """
     process = DpdkProcess(
         binary_path=str(binary_path),
-        config_path=str(test_config),
+        config_path=str(test_config.path),
         startup_timeout=30,
         shutdown_timeout=10
     )
@@ -201,27 +302,16 @@ def dpdk_process(binary_path, test_config, test_output_dir, request):
     if process.is_running():
         # Try graceful shutdown first
         process.terminate(graceful=True)
-        time.sleep(1)
         
         # Force kill if still running
-        if process.is_running():
+        try:
+            process.wait(timeout=2.0)
+        except subprocess.TimeoutExpired:
             process.terminate(graceful=False)
-    
-    # Save logs on failure
-    test_failed = request.node.rep_call.failed if hasattr(request.node, 'rep_call') else False
-    if test_failed:
-        log_file = test_output_dir / f"{request.node.name}_output.log"
-        with open(log_file, 'w') as f:
-            f.write("=== DPDK Process Output ===\n")
-            f.write(f"Exit code: {process.get_exit_code()}\n")
-            f.write(f"Error message: {process.error_message}\n\n")
-            f.write("=== STDOUT ===\n")
-            f.write(process.get_stdout())
-            f.write("\n\n=== STDERR ===\n")
-            f.write(process.get_stderr())
+            process.wait(timeout=2.0)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def control_client(dpdk_process):
     """
     Control client fixture with automatic connection management.
@@ -229,20 +319,20 @@ def control_client(dpdk_process):
     This fixture provides:
     - Automatic Unix socket connection with retry logic
     - Connection verification
-    - Automatic cleanup on test completion
+    - Automatic cleanup once the module's tests are done
     
     Returns:
         ControlClient instance (already connected)
     
-    Scope: function (new client for each test)
+    Scope: module (one connection shared by the tests of a module)
     
     Dependencies:
         Requires dpdk_process fixture (process must be running)
     """
-    client = ControlClient(socket_path="/tmp/dpdk_control.sock")
+    client = ControlClient()
     
     # Connect to socket with retry
-    if not client.connect(timeout=5.0, retry_count=10, retry_delay=0.5):
+    if not client.connect(timeout=5.0, initial_delay=0.01):
         pytest.fail("Failed to connect to control socket")
     
     yield client
@@ -251,7 +341,45 @@ def control_client(dpdk_process):
     client.close()
 
 
+@pytest.fixture(scope="module")
+def _threads_cache():
+    """Holds the module's get_threads response; cleared on relaunch."""
+    return {}
+
+
 @pytest.fixture
+def threads_response(control_client, _threads_cache):
+    """
+    Cached get_threads response for the module's shared process.
+    
+    Thread configuration is fixed for the life of the process, so tests
+    that only inspect it share one round trip instead of each issuing
+    their own get_threads command. reset_dpdk_state drops the cached
+    response when it relaunches the process.
+    
+    Returns:
+        Parsed get_threads response dictionary
+    
+    Scope: function (the response itself is cached per module)
+    """
+    if 'response' not in _threads_cache:
+        _threads_cache['response'] = control_client.get_threads()
+    return _threads_cache['response']
+
+
+def _tap_interface_names(config):
+    """TAP interface names from the net_tap vdevs of a config."""
+    # Parse "net_tap0,iface=dtap0" to extract "dtap0"
+    return [
+        match.group(1)
+        for param_pair in config.get('additional_params', [])
+        if len(param_pair) >= 2 and param_pair[0] == '--vdev' and 'net_tap' in param_pair[1]
+        for match in [_IFACE_RE.search(param_pair[1])]
+        if match
+    ]
+
+
+@pytest.fixture(scope="module")
 def tap_interfaces(test_config, dpdk_process):
     """
     TAP interface fixture for verification and cleanup checking.
@@ -264,33 +392,23 @@ def tap_interfaces(test_config, dpdk_process):
     Returns:
         List of interface names (e.g., ['dtap0', 'dtap1'])
     
-    Scope: function (verifies interfaces for each test)
+    Scope: module (verifies interfaces once per shared process)
     
     Dependencies:
         Requires test_config and dpdk_process fixtures
     """
     # Determine expected interfaces from config
-    with open(test_config) as f:
-        config = json.load(f)
-    
-    # Extract interface names from vdev parameters
-    interfaces = []
-    for param_pair in config.get('additional_params', []):
-        if len(param_pair) >= 2 and param_pair[0] == '--vdev' and 'net_tap' in param_pair[1]:
-            # Parse "net_tap0,iface=dtap0" to extract "dtap0"
-            parts = param_pair[1].split(',')
-            for part in parts:
-                if part.startswith('iface='):
-                    interfaces.append(part.split('=')[1])
+    interfaces = _tap_interface_names(test_config.data)
     
     # Wait for interfaces to appear
-    for iface in interfaces:
-        if not TapInterfaceManager.wait_for_interface(iface, timeout=10):
-            pytest.fail(f"TAP interface {iface} did not appear within timeout")
-    
-    # Verify all interfaces exist
-    if not TapInterfaceManager.verify_interfaces(interfaces):
-        missing = [i for i in interfaces if not TapInterfaceManager.interface_exists(i)]
+    not_created = TapInterfaceManager.wait_for_interfaces(interfaces, timeout=10)
+    if not_created:
+        pytest.fail(f"TAP interfaces {not_created} did not appear within timeout")
+    
+    # Verify all interfaces exist with a single link dump
+    existing = TapInterfaceManager.list_interfaces()
+    missing = [i for i in interfaces if i not in existing]
+    if missing:
         pytest.fail(f"TAP interfaces not found: {missing}")
     
     yield interfaces
@@ -299,14 +417,98 @@ def tap_interfaces(test_config, dpdk_process):
     # We don't verify cleanup here because the process fixture runs after this one
 
 
+@pytest.fixture
+def reset_dpdk_state(request):
+    """
+    Reset protocol for the module-scoped process and client fixtures.
+    
+    Modules that share dpdk_process across tests opt in with
+    pytestmark = pytest.mark.usefixtures("reset_dpdk_state"). Before
+    each test that uses the shared fixtures:
+    - Relaunches the DPDK process if an earlier test stopped it, waits
+      for its TAP interfaces again and drops the cached get_threads
+      response, so no test sees state from the previous process
+    - Drains stale bytes from the control socket and checks liveness
+      with a status command, reconnecting if the connection is gone
+    
+    A relaunch or reconnect is logged as a warning and recorded in the
+    test's user_properties (junit XML), since it usually means an
+    earlier test crashed or stopped the process.
+    
+    Tests that use none of the shared fixtures are left untouched, so
+    no process is spawned on their behalf.
+    
+    Scope: function (runs around every test of an opted-in module)
+    """
+    if 'dpdk_process' not in request.fixturenames:
+        yield
+        return
+    
+    process = request.getfixturevalue('dpdk_process')
+    if not process.is_running():
+        exit_code = process.get_exit_code()
+        logger.warning(
+            "DPDK process exited with code %s before %s; relaunching",
+            exit_code, request.node.nodeid
+        )
+        request.node.user_properties.append(('dpdk_relaunched', exit_code))
+        
+        if not process.reset():
+            pytest.fail(
+                f"Failed to relaunch DPDK process: {process.error_message}\n"
+                f"Stdout:\n{process.get_stdout()}\n"
+                f"Stderr:\n{process.get_stderr()}"
+            )
+        
+        request.getfixturevalue('_threads_cache').clear()
+        
+        interfaces = _tap_interface_names(request.getfixturevalue('test_config').data)
+        not_created = TapInterfaceManager.wait_for_interfaces(interfaces, timeout=10)
+        if not_created:
+            pytest.fail(f"TAP interfaces {not_created} did not appear after relaunch")
+    
+    if 'control_client' in request.fixturenames:
+        client = request.getfixturevalue('control_client')
+        if not client.reset():
+            logger.warning(
+                "Control connection lost before %s; reconnecting", request.node.nodeid
+            )
+            request.node.user_properties.append(('control_reconnected', True))
+            if not client.connect(timeout=5.0, initial_delay=0.01):
+                pytest.fail("Failed to reconnect to control socket")
+    
+    yield
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
     Hook to capture test results for failure diagnostics.
     
     This hook stores test results on the test node so fixtures can
-    access them during teardown to save logs on failure.
+    access them during teardown, and writes the DPDK process output to
+    test_output_dir (as recorded on the session) when a test fails.
+    Passing runs never touch the disk.
+    
+    The process is taken from the dpdk_process fixture, or from a
+    dpdk_process attribute on the node for tests that launch their own.
     """
     outcome = yield
     rep = outcome.get_result()
     setattr(item, f"rep_{rep.when}", rep)
+    
+    if rep.when == 'call' and rep.failed:
+        funcargs = getattr(item, 'funcargs', {})
+        process = funcargs.get('dpdk_process') or getattr(item, 'dpdk_process', None)
+        output_dir = getattr(item.session, 'dpdk_output_dir', None)
+        if process is not None and output_dir is not None:
+            (output_dir / f"{item.name}_output.log").write_text(
+                f"=== DPDK Process Output: {item.nodeid} ===\n"
+                f"Config: {process.config_path}\n"
+                f"Exit code: {process.get_exit_code()}\n"
+                f"Error message: {process.error_message}\n\n"
+                "=== STDOUT ===\n"
+                f"{process.get_stdout()}"
+                "\n\n=== STDERR ===\n"
+                f"{process.get_stderr()}"
+            )
@@ -5,7 +5,7 @@ and memory usage, both when a FIB is loaded and when no FIB is configured.
 """
 
 import pytest
-import time
+import subprocess
 from pathlib import Path
 
 from fixtures.config_generator import TestConfigGenerator
@@ -95,16 +95,18 @@ def fib_dpdk_process(binary_path, fib_test_config, test_output_dir, request):
 
     if process.is_running():
         process.terminate(graceful=True)
-        time.sleep(1)
-        if process.is_running():
+        try:
+            process.wait(timeout=2.0)
+        except subprocess.TimeoutExpired:
             process.terminate(graceful=False)
+            process.wait(timeout=2.0)
 
 
 @pytest.fixture
 def fib_control_client(fib_dpdk_process):
     """Control client connected to the FIB DPDK process."""
-    client = ControlClient(socket_path="/tmp/dpdk_control.sock")
-    if not client.connect(timeout=5.0, retry_count=10, retry_delay=0.5):
+    client = ControlClient()
+    if not client.connect(timeout=5.0, initial_delay=0.01):
         pytest.fail("Failed to connect to control socket")
     yield client
     client.close()
@@ -165,16 +167,18 @@ def no_fib_dpdk_process(binary_path, no_fib_test_config, test_output_dir, reques
 
     if process.is_running():
         process.terminate(graceful=True)
-        time.sleep(1)
-        if process.is_running():
+        try:
+            process.wait(timeout=2.0)
+        except subprocess.TimeoutExpired:
             process.terminate(graceful=False)
+            process.wait(timeout=2.0)
 
 
 @pytest.fixture
 def no_fib_control_client(no_fib_dpdk_process):
     """Control client connected to the no-FIB DPDK process."""
-    client = ControlClient(socket_path="/tmp/dpdk_control.sock")
-    if not client.connect(timeout=5.0, retry_count=10, retry_delay=0.5):
+    client = ControlClient()
+    if not client.connect(timeout=5.0, initial_delay=0.01):
         pytest.fail("Failed to connect to control socket")
     yield client
     client.close()
@@ -10,6 +10,9 @@ import subprocess
 import time
 from scapy.all import conf, Ether, IP, IPv6, TCP, Raw, sendp
 
+# Relaunch/reconnect the module-shared process and client before each test
+pytestmark = pytest.mark.usefixtures("reset_dpdk_state")
+
 # Configuration for five-tuple forwarding tests.
 # net_tap requires equal RX/TX queue counts.
 FIVE_TUPLE_CONFIG = {
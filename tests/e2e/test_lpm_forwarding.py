@@ -125,9 +125,11 @@ def lpm_dpdk_process(binary_path, lpm_test_config, test_output_dir, request):
 
     if process.is_running():
         process.terminate(graceful=True)
-        time.sleep(1)
-        if process.is_running():
+        try:
+            process.wait(timeout=2.0)
+        except subprocess.TimeoutExpired:
             process.terminate(graceful=False)
+            process.wait(timeout=2.0)
 
 
 @pytest.fixture
@@ -135,8 +137,8 @@ def lpm_control_client(lpm_dpdk_process):
     """Control client connected to the LPM DPDK process."""
     from fixtures.control_client import ControlClient
 
-    client = ControlClient(socket_path="/tmp/dpdk_control.sock")
-    if not client.connect(timeout=5.0, retry_count=10, retry_delay=0.5):
+    client = ControlClient()
+    if not client.connect(timeout=5.0, initial_delay=0.01):
         pytest.fail("Failed to connect to control socket")
     yield client
     client.close()
@@ -1,7 +1,7 @@
 """E2E packet statistics tests for DPDK application.
 
 This module tests packet forwarding and per-PMD-thread statistics including:
-- Baseline stats verification (near-zero counters before traffic)
+- Baseline stats verification (near-zero counter change without traffic)
 - Packet forwarding through TAP devices via Scapy
 - Stats counter accuracy after known traffic
 - Multi-thread stats aggregation (per-thread sum equals total)
@@ -13,6 +13,9 @@ import threading
 import time
 from scapy.all import conf, Ether, IP, Raw, sendp, sniff
 
+# Relaunch/reconnect the module-shared process and client before each test
+pytestmark = pytest.mark.usefixtures("reset_dpdk_state")
+
 # net_tap requires equal RX/TX queue counts; processor uses only the first TX queue.
 STATS_CONFIG = {"num_ports": 1, "num_threads": 2, "num_rx_queues": 2, "num_tx_queues": 2}
 
@@ -46,17 +49,25 @@ class TestPacketStats:
         return sniff(iface=iface, count=count, timeout=timeout)
 
     def test_stats_baseline_zero(self, dpdk_process, control_client, tap_interfaces, test_config):
-        """Verify stats counters are near-zero before any traffic is sent.
+        """Verify stats counters stay near-zero while no traffic is sent.
 
-        TAP interfaces may receive a small number of OS-generated packets
-        (e.g. IPv6 Neighbor/Router Solicitation) when brought up, so we
-        allow a small tolerance instead of asserting exactly zero.
+        The process is shared by the module, so earlier tests may already
+        have moved the counters; measure the change over an idle window
+        instead of the absolute values. TAP interfaces may receive a small
+        number of OS-generated packets (e.g. IPv6 Neighbor/Router
+        Solicitation), so we allow a small tolerance instead of zero.
         """
+        baseline = control_client.get_stats()
+        assert baseline['status'] == 'success', "get_stats should succeed"
+        base_packets = baseline['result']['total']['packets']
+
+        time.sleep(1)
+
         response = control_client.get_stats()
         assert response['status'] == 'success', "get_stats should succeed"
 
-        total = response['result']['total']
-        assert total['packets'] <= 5, f"Expected near-zero packets, got {total['packets']}"
+        delta_packets = response['result']['total']['packets'] - base_packets
+        assert delta_packets <= 5, f"Expected near-zero new packets, got {delta_packets}"
 
     def test_packet_forwarding(self, dpdk_process, control_client, tap_interfaces, test_config):
         """Send packets via Scapy and verify they are forwarded back."""
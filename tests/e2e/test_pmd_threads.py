@@ -10,11 +10,14 @@ This module tests PMD thread configuration and management including:
 import pytest
 from typing import Dict, Any, List
 
+# Relaunch/reconnect the module-shared process and client before each test
+pytestmark = pytest.mark.usefixtures("reset_dpdk_state")
+
 
 class TestPmdThreads:
     """Test PMD thread configuration and management."""
     
-    def test_thread_count(self, control_client):
+    def test_thread_count(self, threads_response):
         """
         Test that PMD threads are configured correctly.
         
@@ -22,7 +25,7 @@ class TestPmdThreads:
         PMD threads. The default test configuration uses 2 threads.
         
         Args:
-            control_client: Connected control client fixture
+            threads_response: Cached get_threads response fixture
         
         Validates:
         - get_threads command returns expected number of threads
@@ -31,8 +34,8 @@ class TestPmdThreads:
         
         Requirements: 6.1, 6.4
         """
-        # Get thread information from control plane
-        response = control_client.get_threads()
+        # Thread information from the control plane (fetched once per module)
+        response = threads_response
         
         # Verify response structure
         assert response['status'] == 'success', "get_threads command should succeed"
@@ -52,7 +55,7 @@ class TestPmdThreads:
         for thread in threads:
             assert 'lcore_id' in thread, "Thread should have lcore_id"
     
-    def test_queue_distribution(self, control_client):
+    def test_queue_distribution(self, threads_response):
         """
         Test queue distribution across PMD threads.
         
@@ -61,7 +64,7 @@ class TestPmdThreads:
         is assigned to exactly one thread and that the distribution is correct.
         
         Args:
-            control_client: Connected control client fixture
+            threads_response: Cached get_threads response fixture
         
         Validates:
         - All configured queues are assigned to threads
@@ -71,8 +74,8 @@ class TestPmdThreads:
         
         Requirements: 6.2, 6.5
         """
-        # Get thread information
-        response = control_client.get_threads()
+        # Thread information (fetched once per module)
+        response = threads_response
         assert response['status'] == 'success', "get_threads command should succeed"
         
         threads = response['result']['threads']
@@ -86,7 +89,7 @@ class TestPmdThreads:
             assert isinstance(thread['lcore_id'], int), "lcore_id should be an integer"
             assert thread['lcore_id'] > 0, "lcore_id should be > 0"
     
-    def test_lcore_assignments(self, control_client):
+    def test_lcore_assignments(self, threads_response):
         """
         Test that PMD threads have unique lcore assignments (not 0).
         
@@ -95,7 +98,7 @@ class TestPmdThreads:
         thread (not used by PMD threads).
         
         Args:
-            control_client: Connected control client fixture
+            threads_response: Cached get_threads response fixture
         
         Validates:
         - All PMD threads have lcore_id > 0 (lcore 0 reserved for main)
@@ -104,8 +107,8 @@ class TestPmdThreads:
         
         Requirements: 6.4, 6.6
         """
-        # Get thread information
-        response = control_client.get_threads()
+        # Thread information (fetched once per module)
+        response = threads_response
         assert response['status'] == 'success', "get_threads command should succeed"
         
         threads = response['result']['threads']
@@ -130,7 +133,7 @@ class TestPmdThreads:
             assert lcore_id < max_expected_lcore, \
                 f"lcore_id {lcore_id} seems unreasonably high (expected < {max_expected_lcore})"
     
-    def test_thread_configuration_verification(self, control_client):
+    def test_thread_configuration_verification(self, threads_response):
         """
         Test that get_threads response contains complete thread configuration.
         
@@ -139,7 +142,7 @@ class TestPmdThreads:
         properly formatted.
         
         Args:
-            control_client: Connected control client fixture
+            threads_response: Cached get_threads response fixture
         
         Validates:
         - Response has correct structure (status, result, threads)
@@ -150,8 +153,8 @@ class TestPmdThreads:
         
         Requirements: 6.6
         """
-        # Get thread information
-        response = control_client.get_threads()
+        # Thread information (fetched once per module)
+        response = threads_response
         
         # Verify top-level response structure
         assert isinstance(response, dict), "Response should be a dictionary"
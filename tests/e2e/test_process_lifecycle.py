@@ -9,9 +9,90 @@ This module tests the complete lifecycle of the DPDK process including:
 """
 
 import pytest
-import time
+import subprocess
 from fixtures.dpdk_process import DpdkProcess
 from fixtures.config_generator import TestConfigGenerator
+from fixtures.control_client import ControlClient
+from fixtures.tap_interface import TapInterfaceManager
+from fixtures.worker import DEFAULT_FILE_PREFIX, DEFAULT_TAP_PREFIX, DEFAULT_SOCKET_PATH
+
+# Hard-codes the default TAP names (dtap0, ...); keep out of parallel runs.
+# reset_dpdk_state relaunches/reconnects the module-shared process and client.
+pytestmark = [pytest.mark.serial, pytest.mark.usefixtures("reset_dpdk_state")]
+
+# Names for the private processes started next to the shared dpdk_process
+PRIVATE_FILE_PREFIX = f"{DEFAULT_FILE_PREFIX}_private"
+PRIVATE_TAP_PREFIX = f"{DEFAULT_TAP_PREFIX}p"
+PRIVATE_SOCKET_PATH = DEFAULT_SOCKET_PATH.replace(".sock", "_private.sock")
+
+
+def _write_private_config(test_output_dir, name):
+    """Write a 2-port config using the private names; returns its path."""
+    config_path = test_output_dir / name
+    if not config_path.exists():
+        config = TestConfigGenerator.generate_config(
+            num_ports=2,
+            num_threads=1,
+            num_queues=1,
+            file_prefix=PRIVATE_FILE_PREFIX,
+            tap_prefix=PRIVATE_TAP_PREFIX
+        )
+        TestConfigGenerator.write_config(config, str(config_path))
+    return config_path
+
+
+@pytest.fixture
+def private_dpdk(binary_path, test_output_dir, request):
+    """
+    Fresh DPDK process and connected control client for one test.
+    
+    For tests that end the process: stopping the module-scoped
+    dpdk_process would force a relaunch (full EAL init) for the tests
+    after it. Uses its own file prefix, TAP names and socket so it can
+    run alongside the shared process.
+    
+    Returns:
+        Tuple of (DpdkProcess, ControlClient), both ready for use
+    
+    Scope: function
+    """
+    process = DpdkProcess(
+        binary_path=str(binary_path),
+        config_path=str(_write_private_config(test_output_dir, "private_config.json")),
+        startup_timeout=30,
+        shutdown_timeout=10,
+        socket_path=PRIVATE_SOCKET_PATH
+    )
+    # Lets the failure-log hook in conftest find this process
+    request.node.dpdk_process = process
+    
+    if not process.start():
+        pytest.fail(f"Failed to start DPDK process: {process.error_message}")
+    
+    client = ControlClient(socket_path=PRIVATE_SOCKET_PATH)
+    try:
+        if not process.wait_for_ready():
+            pytest.fail(
+                f"DPDK process failed to initialize: {process.error_message}\n"
+                f"Stdout:\n{process.get_stdout()}\n"
+                f"Stderr:\n{process.get_stderr()}"
+            )
+        
+        if not client.connect(timeout=5.0, initial_delay=0.01):
+            pytest.fail("Failed to connect to control socket")
+        
+        yield process, client
+    
+    finally:
+        client.close()
+        
+        if process.is_running():
+            process.terminate(graceful=True)
+            try:
+                process.wait(timeout=2.0)
+            except subprocess.TimeoutExpired:
+                process.terminate(graceful=False)
+                process.wait(timeout=2.0)
 
 
 class TestProcessLifecycle:
@@ -64,7 +145,7 @@ class TestProcessLifecycle:
         # Check for control plane running (stdout)
         assert 'ControlPlane running, event loop started' in stdout, "Should show control plane running message"
     
-    def test_graceful_shutdown(self, control_client, dpdk_process):
+    def test_graceful_shutdown(self, private_dpdk):
         """
         Test graceful shutdown via control command.
         
@@ -75,21 +156,17 @@ class TestProcessLifecycle:
         
         Requirements: 4.5
         """
+        process, client = private_dpdk
+        
         # Send shutdown command
-        response = control_client.shutdown()
+        response = client.shutdown()
         assert response['status'] == 'success', "Shutdown command should succeed"
         
         # Wait for process to terminate
-        timeout = 10
-        start = time.time()
-        while dpdk_process.is_running() and (time.time() - start) < timeout:
-            time.sleep(0.1)
-        
-        # Verify process terminated
-        assert not dpdk_process.is_running(), "Process should have terminated"
+        assert process.wait_exit(timeout=10), "Process should have terminated"
         
         # Verify clean exit
-        exit_code = dpdk_process.get_exit_code()
+        exit_code = process.get_exit_code()
         assert exit_code == 0, f"Process should exit with code 0, got {exit_code}"
     
     def test_startup_timeout(self, binary_path, test_output_dir):
@@ -102,23 +179,15 @@ class TestProcessLifecycle:
         
         Requirements: 4.7
         """
-        # Create a configuration that will cause initialization issues
-        # Using an extremely high number of ports that won't be available
-        config = TestConfigGenerator.generate_config(
-            num_ports=2,
-            num_threads=1,
-            num_queues=1
-        )
-        
-        # Modify config to use invalid parameters that will cause slow/failed init
+        # Private names so the shared dpdk_process can keep running
         # We'll use a very short timeout to test the timeout mechanism
-        config_path = test_output_dir / "timeout_test_config.json"
-        TestConfigGenerator.write_config(config, str(config_path))
+        config_path = _write_private_config(test_output_dir, "timeout_test_config.json")
         
         process = DpdkProcess(
             binary_path=str(binary_path),
             config_path=str(config_path),
-            startup_timeout=2  # Very short timeout
+            startup_timeout=2,  # Very short timeout
+            socket_path=PRIVATE_SOCKET_PATH
         )
         
         # Start process
@@ -150,18 +219,13 @@ class TestProcessLifecycle:
         
         Requirements: 3.1, 3.6
         """
-        from fixtures.tap_interface import TapInterfaceManager
-        
-        # Verify both interfaces exist
-        assert TapInterfaceManager.interface_exists('dtap0'), "dtap0 should exist"
-        assert TapInterfaceManager.interface_exists('dtap1'), "dtap1 should exist"
-        
-        # Get interface information
+        # Read only the two TAP ports, not every interface on the host
         dtap0_info = TapInterfaceManager.get_interface_info('dtap0')
         dtap1_info = TapInterfaceManager.get_interface_info('dtap1')
         
-        assert dtap0_info is not None, "Should get dtap0 info"
-        assert dtap1_info is not None, "Should get dtap1 info"
+        # Verify both interfaces exist
+        assert dtap0_info is not None, "dtap0 should exist"
+        assert dtap1_info is not None, "dtap1 should exist"
         
         # Verify interfaces have expected properties
         assert 'state' in dtap0_info, "dtap0 should have state"
@@ -10,6 +10,10 @@ import subprocess
 import time
 from scapy.all import conf, Ether, IP, IPv6, TCP, UDP, Raw, sendp
 
+# Hard-codes the default TAP names (dtap0, ...); keep out of parallel runs.
+# reset_dpdk_state relaunches/reconnects the module-shared process and client.
+pytestmark = [pytest.mark.serial, pytest.mark.usefixtures("reset_dpdk_state")]
+
 # Configuration for session table tests.
 # Uses five_tuple_forwarding processor with session tracking enabled.
 SESSION_CONFIG = {
@@ -73,19 +77,26 @@ class TestSessionTable:
     """Test session table behavior via get_sessions command."""
 
     def test_empty_session_table(self, dpdk_process, control_client):
-        """Verify get_sessions returns success with at most a few OS-generated sessions.
+        """Verify get_sessions succeeds and gains at most a few sessions without traffic.
 
-        TAP interfaces may receive OS-generated packets (e.g. IPv6 Neighbor/Router
-        Solicitation) when brought up, so we allow a small tolerance.
+        The process is shared by the module, so earlier tests may already
+        have added sessions; compare against a baseline taken at the start
+        of the test. TAP interfaces may receive OS-generated packets (e.g.
+        IPv6 Neighbor/Router Solicitation), so we allow a small tolerance.
 
         Validates: Requirements 6.1
         """
-        response = control_client.get_sessions()
+        baseline = control_client.get_sessions()
+        assert baseline['status'] == 'success', f"Expected success, got: {baseline}"
+        base_count = len(collect_sessions(baseline))
 
+        time.sleep(1)
+
+        response = control_client.get_sessions()
         assert response['status'] == 'success', f"Expected success, got: {response}"
         sessions = collect_sessions(response)
-        assert len(sessions) <= 10, \
-            f"Expected at most a few OS-generated sessions, got {len(sessions)}: {sessions}"
+        assert len(sessions) - base_count <= 10, \
+            f"Expected at most a few new OS-generated sessions, got {len(sessions) - base_count}: {sessions}"
 
     def test_single_ipv4_session(self, dpdk_process, control_client, tap_interfaces, test_config):
         """Send a single IPv4/TCP packet and verify the session entry.
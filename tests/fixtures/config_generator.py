@@ -4,35 +4,27 @@ This module provides utilities to generate dpdk.json configuration files
 for testing with net_tap virtual PMD driver.
 """
 
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Any
-import json
+import functools
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
 
+from .json_util import dumps, loads
+from .worker import DEFAULT_FILE_PREFIX, DEFAULT_TAP_PREFIX
 
-@dataclass
-class QueueAssignment:
-    """Represents a (port, queue) assignment."""
-    port_id: int
-    queue_id: int
-
+# Core masks for the thread counts the suite uses (main lcore + workers)
+_CORE_MASKS = {1: "0x3", 2: "0x7"}
 
-@dataclass
-class PmdThreadConfig:
-    """Configuration for a single PMD thread."""
-    lcore_id: int
-    rx_queues: List[Dict[str, int]]
-    tx_queues: List[Dict[str, int]]
+# DPDK_TEST_PRETTY values that leave pretty-printing off
+_FALSE_VALUES = ("", "0", "false", "no", "off")
 
 
 @dataclass
-class PortConfig:
-    """Configuration for a DPDK port."""
-    port_id: int
-    num_rx_queues: int
-    num_tx_queues: int
-    num_descriptors: int
-    mbuf_pool_size: int
-    mbuf_size: int
+class GeneratedConfig:
+    """A configuration written to disk together with its parsed contents."""
+    path: Path
+    data: Dict[str, Any]
 
 
 class TestConfigGenerator:
@@ -50,7 +42,9 @@ class TestConfigGenerator:
         processor_params: Dict[str, str] = None,
         session_capacity: int = 0,
         fib_file: str = None,
-        fib_algorithm: str = "lpm"
+        fib_algorithm: str = "lpm",
+        file_prefix: str = DEFAULT_FILE_PREFIX,
+        tap_prefix: str = DEFAULT_TAP_PREFIX
     ) -> Dict[str, Any]:
         """
         Generate a test configuration with net_tap virtual PMD.
@@ -67,9 +61,14 @@ class TestConfigGenerator:
             session_capacity: Session table capacity (0 = disabled, omitted from config)
             fib_file: Optional path to FIB file
             fib_algorithm: FIB algorithm: "lpm" or "tbm" (default: "lpm")
+            file_prefix: EAL --file-prefix; must differ between DPDK processes
+                running at the same time (default: per xdist worker)
+            tap_prefix: TAP interface name prefix, port N gets "<prefix>N";
+                must differ between concurrent processes (default: per xdist worker)
         
         Returns:
-            Dictionary representing dpdk.json configuration
+            Dictionary representing dpdk.json configuration (a fresh copy
+            per call, safe to mutate)
         
         Raises:
             ValueError: If parameters are out of valid range
@@ -89,49 +88,75 @@ class TestConfigGenerator:
         if num_tx_queues < 1:
             raise ValueError("num_tx_queues must be >= 1")
         
+        params_key = tuple(processor_params.items()) if processor_params is not None else None
+        blob = TestConfigGenerator._build_config(
+            num_ports, num_threads, num_rx_queues, num_tx_queues, use_hugepages,
+            processor_name, params_key, session_capacity, fib_file, fib_algorithm,
+            file_prefix, tap_prefix
+        )
+        return loads(blob)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _build_config(
+        num_ports: int,
+        num_threads: int,
+        num_rx_queues: int,
+        num_tx_queues: int,
+        use_hugepages: bool,
+        processor_name: Optional[str],
+        processor_params: Optional[Tuple[Tuple[str, str], ...]],
+        session_capacity: int,
+        fib_file: Optional[str],
+        fib_algorithm: str,
+        file_prefix: str,
+        tap_prefix: str
+    ) -> bytes:
+        """
+        Build the configuration for validated arguments, memoized by them.
+        
+        Returns the encoded JSON rather than the dict so cached entries
+        can't be mutated by callers; processor_params is a tuple of
+        (key, value) pairs to keep the arguments hashable.
+        """
         # Generate core mask (main lcore + worker lcores)
         core_mask = TestConfigGenerator.generate_core_mask(num_threads)
         
-        # Generate additional EAL parameters
-        additional_params = []
-        if not use_hugepages:
-            additional_params.append(["--no-huge", ""])
-        additional_params.append(["--no-pci", ""])
+        # Generate additional EAL parameters as [flag, value] pairs; the
+        # config parser skips entries with fewer than two elements
+        additional_params = [] if use_hugepages else [["--no-huge", ""]]
         # Use file-prefix to avoid /var/run/dpdk permission issues
-        additional_params.append(["--file-prefix", "dpdk_test"])
+        additional_params += [["--no-pci", ""], ["--file-prefix", file_prefix]]
         
         # Add vdev for each port with net_tap
-        for port_id in range(num_ports):
-            vdev_spec = f"net_tap{port_id},iface=dtap{port_id}"
-            additional_params.append(["--vdev", vdev_spec])
+        additional_params += [
+            ["--vdev", f"net_tap{port_id},iface={tap_prefix}{port_id}"]
+            for port_id in range(num_ports)
+        ]
         
         # Generate port configurations
         ports = []
         for port_id in range(num_ports):
-            port = PortConfig(
-                port_id=port_id,
-                num_rx_queues=num_rx_queues,
-                num_tx_queues=num_tx_queues,
-                num_descriptors=512,  # Small for testing
-                mbuf_pool_size=4096,  # Sufficient for test workloads
-                mbuf_size=2048        # Standard Ethernet
-            )
-            ports.append(asdict(port))
+            ports.append({
+                "port_id": port_id,
+                "num_rx_queues": num_rx_queues,
+                "num_tx_queues": num_tx_queues,
+                "num_descriptors": 512,  # Small for testing
+                "mbuf_pool_size": 4096,  # Sufficient for test workloads
+                "mbuf_size": 2048        # Standard Ethernet
+            })
         
         # Distribute queues across threads
         pmd_threads = TestConfigGenerator.distribute_queues(
             num_ports, num_rx_queues, num_tx_queues, num_threads
         )
         
-        # Build pmd_threads entries, optionally including processor settings
-        pmd_thread_dicts = []
-        for t in pmd_threads:
-            entry = asdict(t)
+        # Optionally add processor settings to each pmd_threads entry
+        for entry in pmd_threads:
             if processor_name is not None:
                 entry["processor"] = processor_name
             if processor_params is not None:
-                entry["processor_params"] = processor_params
-            pmd_thread_dicts.append(entry)
+                entry["processor_params"] = dict(processor_params)
 
         # Build configuration
         config = {
@@ -139,7 +164,7 @@ class TestConfigGenerator:
             "memory_channels": 4,
             "additional_params": additional_params,
             "ports": ports,
-            "pmd_threads": pmd_thread_dicts
+            "pmd_threads": pmd_threads
         }
 
         if session_capacity > 0:
@@ -148,7 +173,7 @@ class TestConfigGenerator:
         if fib_file is not None:
             config["fib_file"] = f"{fib_file}, {fib_algorithm}"
         
-        return config
+        return dumps(config)
     
     @staticmethod
     def generate_core_mask(num_threads: int) -> str:
@@ -168,10 +193,13 @@ class TestConfigGenerator:
             >>> TestConfigGenerator.generate_core_mask(2)
             '0x7'  # lcores 0, 1, 2
         """
+        mask = _CORE_MASKS.get(num_threads)
+        if mask is not None:
+            return mask
+        
         # Main lcore (0) + worker lcores (1..num_threads)
         total_cores = num_threads + 1
-        mask = (1 << total_cores) - 1
-        return f"0x{mask:x}"
+        return f"0x{(1 << total_cores) - 1:x}"
     
     @staticmethod
     def distribute_queues(
@@ -179,7 +207,7 @@ class TestConfigGenerator:
         num_rx_queues: int,
         num_tx_queues: int,
         num_threads: int
-    ) -> List[PmdThreadConfig]:
+    ) -> List[Dict[str, Any]]:
         """
         Distribute queues evenly across PMD threads using round-robin.
         
@@ -195,24 +223,24 @@ class TestConfigGenerator:
             num_threads: Number of PMD threads
         
         Returns:
-            List of PMD thread configurations
+            List of pmd_threads entries ({"lcore_id", "rx_queues", "tx_queues"})
         """
         # Create thread configs
         threads = []
         for i in range(num_threads):
             lcore_id = i + 1  # Skip lcore 0 (main)
-            threads.append(PmdThreadConfig(
-                lcore_id=lcore_id,
-                rx_queues=[],
-                tx_queues=[]
-            ))
+            threads.append({
+                "lcore_id": lcore_id,
+                "rx_queues": [],
+                "tx_queues": []
+            })
         
         # Distribute RX queues round-robin
         thread_idx = 0
         for port_id in range(num_ports):
             for queue_id in range(num_rx_queues):
                 assignment = {"port_id": port_id, "queue_id": queue_id}
-                threads[thread_idx].rx_queues.append(assignment)
+                threads[thread_idx]["rx_queues"].append(assignment)
                 thread_idx = (thread_idx + 1) % num_threads
         
         # Distribute TX queues round-robin
@@ -220,7 +248,7 @@ class TestConfigGenerator:
         for port_id in range(num_ports):
             for queue_id in range(num_tx_queues):
                 assignment = {"port_id": port_id, "queue_id": queue_id}
-                threads[thread_idx].tx_queues.append(assignment)
+                threads[thread_idx]["tx_queues"].append(assignment)
                 thread_idx = (thread_idx + 1) % num_threads
         
         return threads
@@ -230,6 +258,10 @@ class TestConfigGenerator:
         """
         Write configuration to JSON file.
         
+        Written compactly; set DPDK_TEST_PRETTY=1 to indent the output
+        when a config needs to be read by hand (0, false, no and off,
+        in any case, keep it compact).
+        
         Args:
             config: Configuration dictionary
             path: Output file path
@@ -238,5 +270,6 @@ class TestConfigGenerator:
             >>> config = TestConfigGenerator.generate_config()
             >>> TestConfigGenerator.write_config(config, "test_config.json")
         """
-        with open(path, 'w') as f:
-            json.dump(config, f, indent=2)
+        with open(path, 'wb') as f:
+            pretty = os.environ.get("DPDK_TEST_PRETTY", "").strip().lower()
+            f.write(dumps(config, indent=pretty not in _FALSE_VALUES))
@@ -1,38 +1,124 @@
 """Control client for DPDK control plane Unix socket."""
 
+import ctypes
+import os
+import select
 import socket
 import json
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
+from .json_util import dumps as _dumps, loads as _loads
+from .worker import DEFAULT_SOCKET_PATH
+
+# Wire form of the parameterless commands, encoded once at import
+_PRECOMPUTED = {
+    command: _dumps({"command": command}) + b"\n"
+    for command in (
+        "status",
+        "get_threads",
+        "get_stats",
+        "get_flow_table",
+        "get_sessions",
+        "get_fib_info",
+        "shutdown",
+    )
+}
+
+
+# Size of the reusable receive chunk
+_RECV_CHUNK_SIZE = 64 * 1024
+
+# inotify event masks (linux/inotify.h)
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+
+
+def _wait_for_path(path: str, timeout: float) -> bool:
+    """
+    Block until path exists, using an inotify watch on its directory.
+    
+    Returns:
+        True if the path exists; False on timeout or when inotify is
+        unavailable, in which case the caller falls back to sleeping
+    """
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return False
+    if fd < 0:
+        return False
+    
+    try:
+        directory = os.path.dirname(os.path.abspath(path))
+        if libc.inotify_add_watch(fd, os.fsencode(directory), _IN_CREATE | _IN_MOVED_TO) < 0:
+            return False
+        
+        # Check after the watch is in place so a creation in between is not lost
+        deadline = time.monotonic() + timeout
+        while not os.path.exists(path):
+            time_left = deadline - time.monotonic()
+            if time_left <= 0:
+                return False
+            readable, _, _ = select.select([fd], [], [], time_left)
+            if readable:
+                try:
+                    os.read(fd, 4096)  # Drain events; the path is re-checked above
+                except BlockingIOError:
+                    pass
+        return True
+    finally:
+        os.close(fd)
+
 
 class ControlClient:
     """Client for DPDK control plane Unix socket."""
     
-    def __init__(self, socket_path: str = "/tmp/dpdk_control.sock"):
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH):
         """
         Initialize control client.
         
         Args:
-            socket_path: Path to Unix domain socket
+            socket_path: Path to Unix domain socket (default: per xdist worker)
         """
         self.socket_path = socket_path
         self.sock: Optional[socket.socket] = None
+        self._recv_buf = bytearray()
+        # Reusable receive chunk so recv_into() does not allocate per call;
+        # sized so that even get_flow_table/get_sessions dumps usually
+        # arrive in a single recv
+        self._chunk = bytearray(_RECV_CHUNK_SIZE)
+        self._chunk_view = memoryview(self._chunk)
     
-    def connect(self, timeout: float = 5.0, retry_count: int = 10, retry_delay: float = 0.5) -> bool:
+    def connect(
+        self,
+        timeout: float = 5.0,
+        initial_delay: float = 0.01,
+        max_delay: float = 0.5
+    ) -> bool:
         """
-        Connect to the control plane socket with retry logic.
+        Connect to the control plane socket with exponential backoff.
+        
+        While the socket file does not exist yet, waits on an inotify
+        watch of its directory so the connect happens as soon as the
+        server creates it. Other retries (server bound but not yet
+        listening, or no inotify) start quickly and the delay doubles up
+        to max_delay.
         
         Args:
-            timeout: Socket operation timeout in seconds
-            retry_count: Number of connection attempts
-            retry_delay: Delay between retry attempts in seconds
+            timeout: Overall connect deadline, also used as the socket
+                operation timeout, in seconds
+            initial_delay: Delay before the first retry in seconds
+            max_delay: Upper bound for the delay between retries in seconds
         
         Returns:
             True if connected successfully
         """
-        for attempt in range(retry_count):
+        start = time.monotonic()
+        delay = initial_delay
+        while True:
             try:
                 # Create Unix domain socket
                 self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
@@ -42,40 +128,21 @@ class ControlClient:
                 self.sock.connect(self.socket_path)
                 return True
                 
-            except FileNotFoundError:
-                # Socket file doesn't exist yet
-                if attempt < retry_count - 1:
-                    time.sleep(retry_delay)
-                    if self.sock:
-                        self.sock.close()
-                        self.sock = None
-                else:
-                    if self.sock:
-                        self.sock.close()
-                        self.sock = None
-                    return False
-                    
-            except ConnectionRefusedError:
-                # Server not ready yet
-                if attempt < retry_count - 1:
-                    time.sleep(retry_delay)
-                    if self.sock:
-                        self.sock.close()
-                        self.sock = None
-                else:
-                    if self.sock:
-                        self.sock.close()
-                        self.sock = None
+            except (FileNotFoundError, ConnectionRefusedError) as e:
+                # Socket file doesn't exist yet or server not ready yet
+                self.close()
+                remaining = timeout - (time.monotonic() - start)
+                if remaining <= 0:
                     return False
+                if isinstance(e, FileNotFoundError) and _wait_for_path(self.socket_path, remaining):
+                    continue
+                time.sleep(min(delay, remaining))
+                delay = min(delay * 2, max_delay)
                     
-            except Exception as e:
+            except Exception:
                 # Other connection errors
-                if self.sock:
-                    self.sock.close()
-                    self.sock = None
+                self.close()
                 return False
-        
-        return False
     
     def send_command(self, command: str, **kwargs) -> Dict[str, Any]:
         """
@@ -96,37 +163,24 @@ class ControlClient:
         if self.sock is None:
             raise ConnectionError("Not connected to control socket")
         
-        # Build command JSON
-        cmd_dict = {"command": command}
-        if kwargs:
+        # Constant commands are pre-encoded; build JSON only when needed
+        cmd_json = None if kwargs else _PRECOMPUTED.get(command)
+        if cmd_json is None:
+            cmd_dict = {"command": command}
             cmd_dict.update(kwargs)
-        
-        # Serialize to JSON with newline delimiter
-        cmd_json = json.dumps(cmd_dict) + "\n"
+            
+            # Serialize to JSON with newline delimiter
+            cmd_json = _dumps(cmd_dict) + b"\n"
         
         try:
             # Send command
-            self.sock.sendall(cmd_json.encode('utf-8'))
+            self.sock.sendall(cmd_json)
             
-            # Receive response
-            response_data = b""
-            while True:
-                chunk = self.sock.recv(4096)
-                if not chunk:
-                    # Server closed connection — use whatever we have
-                    if response_data:
-                        break
-                    raise ConnectionError("Connection closed by server")
-                
-                response_data += chunk
-                
-                # Check if we have a complete JSON response (ends with newline)
-                if b'\n' in response_data:
-                    break
+            # Receive response (one newline-delimited line)
+            response_data, _ = self.recv_one()
             
             # Parse JSON response
-            response_str = response_data.decode('utf-8').strip()
-            response = json.loads(response_str)
+            response = _loads(response_data)
             
             return response
             
@@ -137,6 +191,103 @@ class ControlClient:
         except Exception as e:
             raise ConnectionError(f"Failed to send command: {e}")
     
+    def pipeline(self, commands: List[str]) -> List[Dict[str, Any]]:
+        """
+        Send several parameterless commands and collect their responses.
+        
+        All requests go out in one write and the replies are read back
+        in order, so N commands cost one round trip instead of N.
+        
+        Args:
+            commands: Command names, e.g. ["status", "get_threads"]
+        
+        Returns:
+            Parsed JSON responses in request order
+        
+        Raises:
+            ConnectionError: If not connected
+            ValueError: If a response is invalid JSON
+            TimeoutError: If responses not received within timeout
+        """
+        if self.sock is None:
+            raise ConnectionError("Not connected to control socket")
+        
+        payload = b"".join(
+            _PRECOMPUTED.get(command) or _dumps({"command": command}) + b"\n"
+            for command in commands
+        )
+        
+        try:
+            self.sock.sendall(payload)
+            return [_loads(self.recv_one()[0]) for _ in commands]
+        
+        except socket.timeout:
+            raise TimeoutError(f"Commands {commands} timed out")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON response: {e}")
+        except Exception as e:
+            raise ConnectionError(f"Failed to send commands: {e}")
+    
+    def send_raw(self, data: bytes) -> None:
+        """
+        Send pre-encoded, newline-delimited command bytes as-is.
+        
+        Several commands may be concatenated to pipeline them in one
+        write; read the replies back one at a time with recv_one().
+        
+        Args:
+            data: One or more encoded commands, each ending in a newline
+        
+        Raises:
+            ConnectionError: If not connected
+        """
+        if self.sock is None:
+            raise ConnectionError("Not connected to control socket")
+        
+        self.sock.sendall(data)
+    
+    def recv_one(self) -> Tuple[bytes, int]:
+        """
+        Receive a single newline-delimited response.
+        
+        Bytes past the first newline are kept for the next call, so
+        pipelined replies are returned in order, one per call. Chunks are
+        appended to one growing buffer and only the new bytes are scanned
+        for the delimiter, so assembling a large reply is linear.
+        
+        Returns:
+            Tuple of (response bytes without the newline,
+            time.monotonic_ns() when the response was taken from the
+            buffer; for pipelined replies that can be well after their
+            bytes arrived, as one recv often holds several)
+        
+        Raises:
+            ConnectionError: If not connected or the server closed the
+                connection before sending anything
+        """
+        if self.sock is None:
+            raise ConnectionError("Not connected to control socket")
+        
+        scan_from = 0
+        while True:
+            newline = self._recv_buf.find(b'\n', scan_from)
+            if newline >= 0:
+                line = bytes(self._recv_buf[:newline])
+                del self._recv_buf[:newline + 1]
+                return line, time.monotonic_ns()
+            scan_from = len(self._recv_buf)
+            
+            n = self.sock.recv_into(self._chunk)
+            if n == 0:
+                # Server closed connection — use whatever we have
+                if self._recv_buf:
+                    line = bytes(self._recv_buf)
+                    self._recv_buf.clear()
+                    return line, time.monotonic_ns()
+                raise ConnectionError("Connection closed by server")
+            
+            self._recv_buf += self._chunk_view[:n]
+    
     def status(self) -> Dict[str, Any]:
         """
         Send status command.
@@ -146,6 +297,24 @@ class ControlClient:
         """
         return self.send_command("status")
     
+    def status_prepared(self, count: int = 1) -> List[Tuple[bytes, int]]:
+        """
+        Send count pre-encoded status commands in one write.
+        
+        No JSON is built or parsed per call, so timing loops measure the
+        server rather than client-side serialization. Only with count=1
+        is the returned time a round-trip completion time; see recv_one().
+        
+        Args:
+            count: Number of status commands to pipeline
+        
+        Returns:
+            List of (raw response bytes, completion time in
+            time.monotonic_ns()) in request order
+        """
+        self.send_raw(_PRECOMPUTED["status"] * count)
+        return [self.recv_one() for _ in range(count)]
+    
     def get_threads(self) -> Dict[str, Any]:
         """
         Send get_threads command.
@@ -190,6 +359,44 @@ class ControlClient:
             # This is expected behavior for a shutdown command.
             return {"status": "success", "result": {"message": "Shutdown initiated"}}
     
+    def reset(self) -> bool:
+        """
+        Drain stale response bytes and verify the connection is still live.
+
+        Used between tests that share a module-scoped client so one test's
+        leftovers (e.g. an unread reply) never leak into the next.
+
+        Returns:
+            True if the connection is usable, False if it must be reopened
+        """
+        if self.sock is None:
+            return False
+
+        self._recv_buf.clear()
+        saved_timeout = self.sock.gettimeout()
+        self.sock.settimeout(0)
+        try:
+            while True:
+                chunk = self.sock.recv(4096)
+                if not chunk:
+                    # Server closed the connection (e.g. after shutdown)
+                    self.close()
+                    return False
+        except BlockingIOError:
+            pass  # Nothing left to drain
+        except OSError:
+            self.close()
+            return False
+        finally:
+            if self.sock:
+                self.sock.settimeout(saved_timeout)
+
+        try:
+            return self.status().get('status') == 'success'
+        except (ConnectionError, TimeoutError, ValueError):
+            self.close()
+            return False
+
     def close(self) -> None:
         """Close the socket connection."""
         if self.sock:
@@ -199,6 +406,7 @@ class ControlClient:
                 pass  # Ignore errors during close
             finally:
                 self.sock = None
+                self._recv_buf.clear()
     
     def __enter__(self):
         """Context manager entry."""
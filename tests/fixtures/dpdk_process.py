@@ -2,14 +2,39 @@
 
 import fcntl
 import os
+import re
 import selectors
 import subprocess
-import time
 import signal
+import sys
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 import threading
 
+from .worker import DEFAULT_SOCKET_PATH
+
+# Read size for the output pipes; matches the default 64 KiB pipe buffer
+# so a full pipe is drained in one read
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Kernel buffer requested for the output pipes, so a burst of init
+# logging does not block the child while the capture thread catches up
+_PIPE_SIZE = 1024 * 1024
+_F_SETPIPE_SZ = getattr(fcntl, "F_SETPIPE_SZ", 1031)
+
+# Captured output kept per stream; past this, the oldest half is dropped
+_MAX_OUTPUT_BYTES = 4 * 1024 * 1024
+
+# Startup verdict markers in stdout: ready, or an initialization error
+_READY_MARKER = b"Control plane ready"
+_STARTUP_MARKERS = re.compile(rb"Control plane ready|EAL: Error|FATAL")
+# Unscanned tail kept when scanning an unfinished line, so a marker split
+# across reads is still matched (the ready marker is the longest)
+_MARKER_OVERLAP = len(_READY_MARKER) - 1
+
+# One eventfd increment; also a valid (8-byte) write to the pipe fallback
+_WAKE = (1).to_bytes(8, sys.byteorder)
+
 
 class DpdkProcess:
     """Manages DPDK application process lifecycle."""
@@ -19,42 +44,73 @@ class DpdkProcess:
         binary_path: str,
         config_path: str,
         startup_timeout: int = 30,
-        shutdown_timeout: int = 10
+        shutdown_timeout: int = 10,
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        max_output_bytes: int = _MAX_OUTPUT_BYTES
     ):
         self.binary_path = binary_path
         self.config_path = config_path
+        self.socket_path = socket_path
         self.startup_timeout = startup_timeout
         self.shutdown_timeout = shutdown_timeout
+        self.max_output_bytes = max_output_bytes
         self.process: Optional[subprocess.Popen] = None
-        self.stdout_lines: List[str] = []
-        self.stderr_lines: List[str] = []
+        # Captured output as read from the pipes, bounded to the most
+        # recent max_output_bytes; decoded only when asked for, and cached
+        # as (bytes received, text) until more output arrives
+        self._stdout_raw = bytearray()
+        self._stderr_raw = bytearray()
+        self._stdout_received = 0
+        self._stderr_received = 0
+        self._stdout_text = (0, "")
+        self._stderr_text = (0, "")
+        # End of the stdout prefix already searched for startup markers
+        self._scan_from = 0
         self.error_message: str = ""
         self._output_thread: Optional[threading.Thread] = None
-        self._stop_output_capture = False
-
-    @staticmethod
-    def _set_nonblocking(fd):
-        """Set a file descriptor to non-blocking mode."""
-        flags = fcntl.fcntl(fd, fcntl.F_GETFL)
-        fcntl.fcntl(fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+        # Wakes the capture thread out of its blocking select (eventfd, or
+        # a pipe's read and write ends); created per capture in start() and
+        # handed to that thread, which closes them as it exits, under
+        # _wake_lock. These attributes only name the current capture's fds
+        self._wake_rfd: Optional[int] = None
+        self._wake_wfd: Optional[int] = None
+        self._wake_lock = threading.Lock()
+        # Set by the capture thread once startup has a verdict: the ready
+        # marker, an error marker, or EOF on the output pipes
+        self._startup_event = threading.Event()
+        self._ready = False
+        self._init_error = False
 
     def start(self) -> bool:
         """Launch the DPDK process. Returns True on success."""
+        # A capture thread left from an earlier launch must not race the
+        # new one for the output state
+        if self._output_thread is not None and self._output_thread.is_alive():
+            self._stop_capture()
+
         try:
+            cmd = [self.binary_path, '-i', self.config_path,
+                   '--socket_path', self.socket_path]
             self.process = subprocess.Popen(
-                [self.binary_path, '-i', self.config_path],
+                cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
             )
 
-            # Make both pipes non-blocking
-            self._set_nonblocking(self.process.stdout.fileno())
-            self._set_nonblocking(self.process.stderr.fileno())
+            self._grow_pipe(self.process.stdout.fileno())
+            self._grow_pipe(self.process.stderr.fileno())
 
             # Start selector-based output capture thread
-            self._stop_output_capture = False
+            wake_rfd, wake_wfd = self._open_wakeup()
+            with self._wake_lock:
+                self._wake_rfd, self._wake_wfd = wake_rfd, wake_wfd
+            self._startup_event.clear()
+            self._ready = False
+            self._init_error = False
+            self._scan_from = 0
             self._output_thread = threading.Thread(
                 target=self._capture_output,
+                args=(self.process, wake_rfd, wake_wfd),
                 daemon=True
             )
             self._output_thread.start()
@@ -71,77 +127,262 @@ class DpdkProcess:
             self.error_message = f"Failed to launch process: {e}"
             return False
 
-    def _capture_output(self):
-        """Capture stdout and stderr using selectors + non-blocking I/O."""
-        if not self.process or not self.process.stdout or not self.process.stderr:
+    @staticmethod
+    def _grow_pipe(fd: int):
+        """Enlarge a pipe's kernel buffer; keep the default if refused."""
+        try:
+            fcntl.fcntl(fd, _F_SETPIPE_SZ, _PIPE_SIZE)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _open_wakeup():
+        """Return (read_fd, write_fd) of an eventfd, or of a pipe without one."""
+        try:
+            fd = os.eventfd(0, os.EFD_CLOEXEC)
+            return fd, fd
+        except (AttributeError, OSError):
+            return os.pipe()
+
+    def _stop_capture(self):
+        """Wake the capture thread and wait for it to exit."""
+        with self._wake_lock:
+            if self._wake_wfd is not None:
+                os.write(self._wake_wfd, _WAKE)
+        if self._output_thread is not None:
+            self._output_thread.join(timeout=2)
+
+    def _close_wakeup(self, wake_rfd: int, wake_wfd: int):
+        """
+        Release a capture's wakeup fds; called by its thread on exit.
+
+        Closes only the fds the thread was started with, and forgets them
+        only if they are still the current ones, so a thread outliving
+        its process never touches the fds of a newer launch.
+        """
+        with self._wake_lock:
+            for fd in {wake_rfd, wake_wfd}:
+                os.close(fd)
+            if self._wake_wfd == wake_wfd:
+                self._wake_rfd = self._wake_wfd = None
+
+    def _trim_output(self, raw: bytearray) -> int:
+        """
+        Drop the oldest output once raw exceeds max_output_bytes.
+
+        Keeps roughly the newest half, cut at a line boundary, so the
+        deletion cost is amortized over many appends.
+
+        Returns:
+            Number of bytes dropped from the front
+        """
+        if len(raw) <= self.max_output_bytes:
+            return 0
+        keep_from = len(raw) - self.max_output_bytes // 2
+        # A trailing newline is no boundary: cutting there keeps nothing
+        cut = raw.find(b'\n', keep_from, len(raw) - 1) + 1 or keep_from
+        del raw[:cut]
+        return cut
+
+    def _scan_stdout(self, final: bool = False):
+        """
+        Check newly completed stdout lines for startup markers.
+
+        Runs one regex search over the raw bytes from the end of the
+        previous scan up to the last newline (or to the end once output
+        is closed), so nothing is rescanned or decoded, and stops once
+        the startup verdict is known. The first marker seen decides the
+        verdict.
+
+        An unfinished line longer than the half _trim_output() keeps is
+        scanned up to its end as well, keeping only _MARKER_OVERLAP bytes
+        unscanned, so the trim never drops bytes that were not searched.
+        """
+        if self._startup_event.is_set():
+            return
+        raw = self._stdout_raw
+        end = len(raw) if final else raw.rfind(b'\n', self._scan_from)
+        resume = end
+        if not final and len(raw) - max(end, self._scan_from) > self.max_output_bytes // 2:
+            end = len(raw)
+            resume = max(self._scan_from, end - _MARKER_OVERLAP)
+        if end < 0:
             return
+        match = _STARTUP_MARKERS.search(raw, self._scan_from, end)
+        self._scan_from = resume
+        if match is None:
+            return
+        if match.group() == _READY_MARKER:
+            self._ready = True
+        else:
+            self._init_error = True
+        self._startup_event.set()
+
+    def _append_stdout(self, data: bytes):
+        """Record a chunk of stdout: scan it for markers, then bound the buffer."""
+        self._stdout_raw += data
+        self._stdout_received += len(data)
+        self._scan_stdout()
+        dropped = self._trim_output(self._stdout_raw)
+        # Until the verdict, the cut takes at most the newline at _scan_from
+        self._scan_from = max(0, self._scan_from - dropped)
+
+    def _append_stderr(self, data: bytes):
+        """Record a chunk of stderr and bound the buffer."""
+        self._stderr_raw += data
+        self._stderr_received += len(data)
+        self._trim_output(self._stderr_raw)
+
+    def _capture_output(self, process: subprocess.Popen, wake_rfd: int, wake_wfd: int):
+        """
+        Capture stdout and stderr on a background thread.
 
-        sel = selectors.DefaultSelector()
-        sel.register(self.process.stdout, selectors.EVENT_READ, 'stdout')
-        sel.register(self.process.stderr, selectors.EVENT_READ, 'stderr')
+        Reads only when the selector reports a pipe readable, so a single
+        os.read() never blocks and the pipes can stay in blocking mode.
+        The thread has to keep draining for the life of the process: a
+        full pipe would stall the DPDK process on its next log write.
+
+        The select blocks with no timeout. _stop_capture() wakes it
+        through the wakeup fd; buffered output is then drained without
+        blocking and the thread exits. The process and wakeup fds are
+        passed in rather than read from self, which start() rebinds.
+        """
+        if not process.stdout or not process.stderr:
+            self._close_wakeup(wake_rfd, wake_wfd)
+            self._startup_event.set()
+            return
 
-        stdout_buf = b''
-        stderr_buf = b''
+        sel = selectors.DefaultSelector()
+        sel.register(process.stdout.fileno(), selectors.EVENT_READ, 'stdout')
+        sel.register(process.stderr.fileno(), selectors.EVENT_READ, 'stderr')
+        sel.register(wake_rfd, selectors.EVENT_READ, 'wake')
 
         open_streams = 2
-        while open_streams > 0 and not self._stop_output_capture:
-            # Short timeout so we can check _stop_output_capture periodically
-            events = sel.select(timeout=0.1)
+        timeout = None  # Block until there is output or a wakeup
+        while open_streams > 0:
+            events = sel.select(timeout)
+            if not events:
+                break  # Woken and nothing buffered is left
             for key, _ in events:
+                if key.data == 'wake':
+                    # Drain whatever is already buffered, then stop
+                    sel.unregister(key.fd)
+                    timeout = 0
+                    continue
+
                 try:
-                    data = key.fileobj.read(4096)
-                except (OSError, ValueError):
+                    data = os.read(key.fd, _READ_CHUNK_SIZE)
+                except OSError:
                     data = b''
 
                 if not data:
                     # EOF on this stream
-                    sel.unregister(key.fileobj)
+                    sel.unregister(key.fd)
                     open_streams -= 1
                     continue
 
                 if key.data == 'stdout':
-                    stdout_buf += data
-                    while b'\n' in stdout_buf:
-                        line, stdout_buf = stdout_buf.split(b'\n', 1)
-                        self.stdout_lines.append(line.decode('utf-8', errors='replace'))
+                    self._append_stdout(data)
                 else:
-                    stderr_buf += data
-                    while b'\n' in stderr_buf:
-                        line, stderr_buf = stderr_buf.split(b'\n', 1)
-                        self.stderr_lines.append(line.decode('utf-8', errors='replace'))
+                    self._append_stderr(data)
 
-        # Flush remaining partial lines
-        if stdout_buf:
-            self.stdout_lines.append(stdout_buf.decode('utf-8', errors='replace'))
-        if stderr_buf:
-            self.stderr_lines.append(stderr_buf.decode('utf-8', errors='replace'))
+        # A final line without a newline still counts
+        self._scan_stdout(final=True)
 
         sel.close()
+        self._close_wakeup(wake_rfd, wake_wfd)
+        # Output is closed: the process exited, wake any wait_for_ready()
+        self._startup_event.set()
 
     def wait_for_ready(self) -> bool:
         """
         Wait for DPDK process to complete initialization.
         Looks for "Control plane ready" message in output.
+
+        Blocks on an event set by the capture thread as soon as the
+        marker (or an error marker, or EOF) is seen, instead of
+        re-scanning the captured output on a timer.
         """
-        start_time = time.time()
+        if not self._startup_event.wait(timeout=self.startup_timeout):
+            self.error_message = f"Initialization timeout after {self.startup_timeout}s"
+            return False
 
-        while time.time() - start_time < self.startup_timeout:
-            if not self.is_running():
-                self.error_message = "Process terminated during initialization"
-                return False
+        if self._ready:
+            return True
 
-            stdout = self.get_stdout()
-            if "Control plane ready" in stdout:
-                return True
+        if self._init_error:
+            self.error_message = "Initialization error detected in output"
+            return False
 
-            if "EAL: Error" in stdout or "FATAL" in stdout:
-                self.error_message = "Initialization error detected in output"
-                return False
+        self.error_message = "Process terminated during initialization"
+        return False
+
+    def reset(self) -> bool:
+        """
+        Make sure the process is up, relaunching it if a test stopped it.
 
-            time.sleep(0.1)
+        Shared (module-scoped) processes call this before each test so a
+        test that shuts the process down does not break the ones after it.
+        """
+        if self.is_running():
+            return True
 
-        self.error_message = f"Initialization timeout after {self.startup_timeout}s"
-        return False
+        # Reap the old process and its capture thread before relaunching
+        self._stop_capture()
+        self._stdout_raw = bytearray()
+        self._stderr_raw = bytearray()
+        self._stdout_received = 0
+        self._stderr_received = 0
+        self._stdout_text = (0, "")
+        self._stderr_text = (0, "")
+        self.error_message = ""
+
+        return self.start() and self.wait_for_ready()
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[int]:
+        """
+        Block until the process exits and return its exit code.
+
+        Returns as soon as the child dies rather than polling (see
+        wait_exit). Raises subprocess.TimeoutExpired if it is still
+        running after timeout seconds.
+        """
+        if self.process is None:
+            return None
+        if not self.wait_exit(timeout):
+            raise subprocess.TimeoutExpired(self.process.args, timeout)
+        return self.process.returncode
+
+    def wait_exit(self, timeout: Optional[float]) -> bool:
+        """
+        Wait up to timeout seconds (None: forever) for the process to exit.
+
+        On Linux >= 5.3 this blocks on a pidfd, waking exactly when the
+        child exits instead of Popen.wait()'s sleep-and-poll loop; other
+        platforms fall back to Popen.wait().
+
+        Returns:
+            True if the process has exited
+        """
+        if self.process is None or self.process.poll() is not None:
+            return True
+
+        try:
+            pidfd = os.pidfd_open(self.process.pid)
+        except (AttributeError, OSError):
+            try:
+                self.process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                return False
+            return True
+
+        try:
+            with selectors.DefaultSelector() as sel:
+                sel.register(pidfd, selectors.EVENT_READ)
+                sel.select(timeout)
+        finally:
+            os.close(pidfd)
+        return self.process.poll() is not None
 
     def is_running(self) -> bool:
         """Check if process is currently running."""
@@ -172,19 +413,44 @@ class DpdkProcess:
             self.error_message = f"Failed to terminate process: {e}"
             return False
         finally:
-            # Stop capture after process terminates so pipes close
-            # and the selector loop exits naturally.
-            self._stop_output_capture = True
-            if self._output_thread:
-                self._output_thread.join(timeout=2)
+            # Stop capture after process terminates; remaining output is
+            # drained before the thread exits.
+            self._stop_capture()
+
+    @staticmethod
+    def _decode_output(
+        raw: bytearray, received: int, cached: Tuple[int, str]
+    ) -> Tuple[int, str]:
+        """Decode raw output in one call, reusing cached until more arrives."""
+        if cached[0] == received:
+            return cached
+        text = raw.decode('utf-8', errors='replace')
+        # Drop a final newline so the text reads like '\n'.join(lines)
+        if text.endswith('\n'):
+            text = text[:-1]
+        return received, text
 
     def get_stdout(self) -> str:
-        """Get captured stdout output."""
-        return '\n'.join(self.stdout_lines)
+        """Get captured stdout output (the most recent max_output_bytes)."""
+        self._stdout_text = self._decode_output(
+            self._stdout_raw, self._stdout_received, self._stdout_text)
+        return self._stdout_text[1]
 
     def get_stderr(self) -> str:
-        """Get captured stderr output."""
-        return '\n'.join(self.stderr_lines)
+        """Get captured stderr output (the most recent max_output_bytes)."""
+        self._stderr_text = self._decode_output(
+            self._stderr_raw, self._stderr_received, self._stderr_text)
+        return self._stderr_text[1]
+
+    @property
+    def stdout_lines(self) -> List[str]:
+        """Captured stdout split into lines."""
+        return self.get_stdout().split('\n') if self._stdout_raw else []
+
+    @property
+    def stderr_lines(self) -> List[str]:
+        """Captured stderr split into lines."""
+        return self.get_stderr().split('\n') if self._stderr_raw else []
 
     def get_exit_code(self) -> Optional[int]:
         """Get process exit code (None if still running)."""
@@ -0,0 +1,28 @@
+"""JSON helpers for the test fixtures.
+
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise. orjson.JSONDecodeError subclasses
+json.JSONDecodeError, so callers catch the stdlib exception either way.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to JSON bytes, compact or indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+
+def loads(data: bytes) -> Any:
+    """Parse JSON from bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
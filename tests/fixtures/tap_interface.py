@@ -4,10 +4,40 @@ This module provides utilities for verifying and managing TAP network interfaces
 created by DPDK's net_tap virtual PMD driver during testing.
 """
 
+import errno
+import fcntl
+import os
+import select
+import socket
+import struct
 import subprocess
 import time
-from typing import List, Optional, Dict, Any
-import re
+from typing import List, Optional, Dict, Any, Set
+
+# rtnetlink multicast group for link add/remove/change notifications
+_RTMGRP_LINK = 0x1
+
+# Interface flag ioctls and struct ifreq layout (linux/sockios.h, net/if.h)
+_SIOCGIFFLAGS = 0x8913
+_SIOCSIFFLAGS = 0x8914
+_IFF_UP = 0x1
+_IFREQ_FLAGS = struct.Struct("16sh22x")  # ifr_name, ifr_flags, rest of the union
+
+_ARPHRD_ETHER = "1"
+_SYS_CLASS_NET = "/sys/class/net"
+
+# sysfs operstate values as reported in the 'state' of get_interface_info();
+# anything else (lowerlayerdown, dormant, ...) is reported as UNKNOWN
+_OPERSTATES = {'up': 'UP', 'down': 'DOWN'}
+
+
+def _read_sysfs(interface_name: str, attribute: str) -> Optional[str]:
+    """Read /sys/class/net/<name>/<attribute>, or None if unavailable."""
+    try:
+        with open(f"{_SYS_CLASS_NET}/{interface_name}/{attribute}") as f:
+            return f.read().strip()
+    except OSError:
+        return None
 
 
 class TapInterfaceManager:
@@ -24,16 +54,24 @@ class TapInterfaceManager:
         Returns:
             True if interface exists
         """
+        # A sysfs stat instead of forking `ip link show`
+        return os.path.exists(f"{_SYS_CLASS_NET}/{interface_name}")
+    
+    @staticmethod
+    def list_interfaces() -> Set[str]:
+        """
+        Get the names of all network interfaces in one call.
+        
+        A single readdir of /sys/class/net; test many names against the
+        returned set instead of probing each one.
+        
+        Returns:
+            Set of interface names (empty if they cannot be listed)
+        """
         try:
-            result = subprocess.run(
-                ['ip', 'link', 'show', interface_name],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+            return set(os.listdir(_SYS_CLASS_NET))
+        except OSError:
+            return set()
     
     @staticmethod
     def wait_for_interface(
@@ -43,6 +81,8 @@ class TapInterfaceManager:
         """
         Wait for a TAP interface to be created.
         
+        Event-driven, see wait_for_interfaces().
+        
         Args:
             interface_name: Interface name to wait for
             timeout: Maximum seconds to wait
@@ -50,12 +90,118 @@ class TapInterfaceManager:
         Returns:
             True if interface appeared within timeout
         """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            if TapInterfaceManager.interface_exists(interface_name):
-                return True
-            time.sleep(0.1)
-        return False
+        return not TapInterfaceManager.wait_for_interfaces([interface_name], timeout)
+    
+    @staticmethod
+    def wait_for_interfaces(
+        interface_names: List[str],
+        timeout: float = 10.0
+    ) -> List[str]:
+        """
+        Wait for several TAP interfaces to be created, sharing one deadline.
+        
+        Listens for rtnetlink link notifications and re-checks only when
+        the kernel reports a link change, instead of polling each
+        interface in turn. (sysfs does not generate inotify events for
+        new devices, so netlink is the kernel's notification path.)
+        
+        If a netlink socket cannot be opened (or fails with anything
+        but ENOBUFS), polls instead: back to back for a short burst, since
+        interfaces usually appear within a few milliseconds, then backing
+        off from 1 ms up to 100 ms.
+        
+        Args:
+            interface_names: Interface names to wait for
+            timeout: Maximum seconds to wait for all of them
+        
+        Returns:
+            Names that did not appear within timeout (empty on success)
+        """
+        deadline = time.monotonic() + timeout
+        remaining = list(interface_names)
+        
+        # Subscribe before the first check so no creation event is missed
+        try:
+            nl_sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE)
+            nl_sock.bind((0, _RTMGRP_LINK))
+        except (AttributeError, OSError):
+            nl_sock = None
+        
+        busy_budget = 32
+        delay = 0.001
+        try:
+            while True:
+                remaining = [
+                    name for name in remaining
+                    if not TapInterfaceManager.interface_exists(name)
+                ]
+                if not remaining:
+                    return []
+                
+                time_left = deadline - time.monotonic()
+                if time_left <= 0:
+                    return remaining
+                
+                if nl_sock is None:
+                    if busy_budget > 0:
+                        busy_budget -= 1
+                        continue
+                    time.sleep(min(delay, time_left))
+                    delay = min(delay * 2, 0.1)
+                    continue
+                
+                readable, _, _ = select.select([nl_sock], [], [], time_left)
+                if readable:
+                    # Only the wakeup matters; the names are re-checked above
+                    try:
+                        nl_sock.recv(65536)
+                    except OSError as e:
+                        # ENOBUFS: a burst of link events overflowed the
+                        # socket buffer, which needs nothing but the re-check.
+                        # Anything else: fall back to polling
+                        if e.errno != errno.ENOBUFS:
+                            nl_sock.close()
+                            nl_sock = None
+        finally:
+            if nl_sock is not None:
+                nl_sock.close()
+    
+    @staticmethod
+    def get_operstate(interface_name: str) -> Optional[str]:
+        """
+        Get the operational state of an interface.
+        
+        A single sysfs read, for callers that need only the state and
+        not the rest of get_interface_info(); uses the same values as
+        its 'state' entry.
+        
+        Args:
+            interface_name: Interface name
+        
+        Returns:
+            "UP", "DOWN" or "UNKNOWN", or None if the interface is missing
+        """
+        operstate = _read_sysfs(interface_name, 'operstate')
+        if operstate is None:
+            return None
+        return _OPERSTATES.get(operstate, 'UNKNOWN')
+    
+    @staticmethod
+    def is_up(interface_name: str) -> bool:
+        """
+        Check if an interface is administratively up (IFF_UP).
+        
+        Checks the interface flags rather than operstate: a TAP device
+        that is up with carrier reports operstate "unknown".
+        
+        Args:
+            interface_name: Interface name
+        
+        Returns:
+            True if the interface exists and has IFF_UP set
+        """
+        flags = _read_sysfs(interface_name, 'flags')
+        return flags is not None and bool(int(flags, 16) & _IFF_UP)
     
     @staticmethod
     def get_interface_info(interface_name: str) -> Optional[Dict[str, Any]]:
@@ -66,55 +212,43 @@ class TapInterfaceManager:
             interface_name: Interface name
         
         Returns:
-            Dictionary with interface info (state, mtu, etc.) or None
+            Dictionary with interface info (state, mtu, etc.), or None if
+            the interface does not exist or disappears while being read
         """
-        try:
-            result = subprocess.run(
-                ['ip', 'link', 'show', interface_name],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            if result.returncode != 0:
-                return None
-            
-            output = result.stdout
-            info = {}
-            
-            # Parse state (UP/DOWN)
-            if 'state UP' in output:
-                info['state'] = 'UP'
-            elif 'state DOWN' in output:
-                info['state'] = 'DOWN'
-            else:
-                info['state'] = 'UNKNOWN'
-            
-            # Parse MTU
-            mtu_match = re.search(r'mtu (\d+)', output)
-            if mtu_match:
-                info['mtu'] = int(mtu_match.group(1))
-            
-            # Parse MAC address
-            mac_match = re.search(r'link/ether ([0-9a-f:]+)', output)
-            if mac_match:
-                info['mac'] = mac_match.group(1)
-            
-            # Parse interface index
-            index_match = re.search(r'^(\d+):', output, re.MULTILINE)
-            if index_match:
-                info['index'] = int(index_match.group(1))
-            
-            return info
-            
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        # Read from sysfs rather than parsing `ip link show` output
+        operstate = _read_sysfs(interface_name, 'operstate')
+        if operstate is None:
             return None
+        
+        info = {'state': _OPERSTATES.get(operstate, 'UNKNOWN')}
+        
+        mtu = _read_sysfs(interface_name, 'mtu')
+        if mtu is not None:
+            info['mtu'] = int(mtu)
+        
+        # Only Ethernet-type links report a MAC, as with `link/ether`
+        if _read_sysfs(interface_name, 'type') == _ARPHRD_ETHER:
+            mac = _read_sysfs(interface_name, 'address')
+            if mac:
+                info['mac'] = mac
+        
+        # Read last: if the interface vanished mid-read, report it as gone
+        # rather than returning partial info
+        index = _read_sysfs(interface_name, 'ifindex')
+        if index is None:
+            return None
+        info['index'] = int(index)
+        
+        return info
     
     @staticmethod
     def set_interface_up(interface_name: str) -> bool:
         """
         Bring a TAP interface up.
         
+        Sets IFF_UP with SIOCGIFFLAGS/SIOCSIFFLAGS ioctls, falling back
+        to `ip link set` if the ioctl path fails.
+        
         Args:
             interface_name: Interface name
         
@@ -122,10 +256,23 @@ class TapInterfaceManager:
             True if successful
         """
         try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                ifreq = _IFREQ_FLAGS.pack(interface_name.encode(), 0)
+                _, flags = _IFREQ_FLAGS.unpack(fcntl.ioctl(sock, _SIOCGIFFLAGS, ifreq))
+                if not flags & _IFF_UP:
+                    ifreq = _IFREQ_FLAGS.pack(interface_name.encode(), flags | _IFF_UP)
+                    fcntl.ioctl(sock, _SIOCSIFFLAGS, ifreq)
+            return True
+        except OSError:
+            pass
+        
+        try:
+            # Python's own fds are non-inheritable (PEP 446), so skipping
+            # the close-all-fds pass in the child leaks nothing
             result = subprocess.run(
                 ['ip', 'link', 'set', interface_name, 'up'],
                 capture_output=True,
-                text=True,
+                close_fds=False,
                 timeout=5
             )
             return result.returncode == 0
@@ -143,7 +290,5 @@ class TapInterfaceManager:
         Returns:
             True if all interfaces exist
         """
-        return all(
-            TapInterfaceManager.interface_exists(name)
-            for name in interface_names
-        )
+        existing = TapInterfaceManager.list_interfaces()
+        return all(name in existing for name in interface_names)
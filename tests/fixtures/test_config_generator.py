@@ -4,6 +4,7 @@ import json
 import tempfile
 import os
 from fixtures.config_generator import TestConfigGenerator
+from fixtures.worker import DEFAULT_TAP_PREFIX
 
 
 def test_generate_config_basic():
@@ -24,16 +25,25 @@ def test_generate_config_basic():
     # Verify core mask
     assert config["core_mask"] == "0x7"  # 3 cores (0, 1, 2)
     
+    # Collect flags and vdev specifications in one pass over the params
+    flags = set()
+    vdev_specs = []
+    for flag, value in config["additional_params"]:
+        flags.add(flag)
+        if flag == "--vdev":
+            vdev_specs.append(value)
+    
     # Verify additional params include required flags
-    params_dict = {param[0]: param[1] for param in config["additional_params"]}
-    assert "--no-huge" in params_dict
-    assert "--no-pci" in params_dict
+    assert "--no-huge" in flags
+    assert "--no-pci" in flags
     
-    # Verify vdev specifications
-    vdev_params = [p for p in config["additional_params"] if p[0] == "--vdev"]
-    assert len(vdev_params) == 2
-    assert any("net_tap0,iface=dtap0" in p[1] for p in vdev_params)
-    assert any("net_tap1,iface=dtap1" in p[1] for p in vdev_params)
+    # Verify vdev specifications: one net_tap per port
+    expected_vdevs = {
+        f"net_tap{port_id},iface={DEFAULT_TAP_PREFIX}{port_id}"
+        for port_id in range(2)
+    }
+    assert len(vdev_specs) == 2
+    assert set(vdev_specs) == expected_vdevs
     
     # Verify ports
     assert len(config["ports"]) == 2
@@ -65,19 +75,19 @@ def test_distribute_queues():
     assert len(threads) == 2
     
     # Verify lcore assignments
-    assert threads[0].lcore_id == 1
-    assert threads[1].lcore_id == 2
+    assert threads[0]["lcore_id"] == 1
+    assert threads[1]["lcore_id"] == 2
     
     # Verify queue distribution (round-robin)
     # Thread 0: port0/queue0, port1/queue0
     # Thread 1: port0/queue1, port1/queue1
-    assert len(threads[0].rx_queues) == 2
-    assert len(threads[1].rx_queues) == 2
+    assert len(threads[0]["rx_queues"]) == 2
+    assert len(threads[1]["rx_queues"]) == 2
     
     # Collect all assigned queues
     all_queues = []
     for thread in threads:
-        for queue in thread.rx_queues:
+        for queue in thread["rx_queues"]:
             all_queues.append((queue["port_id"], queue["queue_id"]))
     
     # Verify all queues are assigned exactly once
@@ -85,6 +95,31 @@ def test_distribute_queues():
     assert sorted(all_queues) == sorted(expected_queues)
 
 
+def test_generate_config_returns_fresh_copies():
+    """Mutating a result must not leak into later calls with the same arguments."""
+    first = TestConfigGenerator.generate_config(num_ports=2, num_threads=2, num_queues=2)
+    expected = json.loads(json.dumps(first))
+    
+    first["core_mask"] = "0xff"
+    first["ports"][0]["num_rx_queues"] = 99
+    first["additional_params"].append(["--log-level", "debug"])
+    first["pmd_threads"].clear()
+    
+    second = TestConfigGenerator.generate_config(num_ports=2, num_threads=2, num_queues=2)
+    assert second == expected
+
+
+def test_generate_config_cached_per_prefix():
+    """file_prefix and tap_prefix are part of the cache key."""
+    base = TestConfigGenerator.generate_config(num_ports=1, file_prefix="a", tap_prefix="ta")
+    other = TestConfigGenerator.generate_config(num_ports=1, file_prefix="b", tap_prefix="tb")
+    
+    assert ["--file-prefix", "a"] in base["additional_params"]
+    assert ["--file-prefix", "b"] in other["additional_params"]
+    assert ["--vdev", "net_tap0,iface=ta0"] in base["additional_params"]
+    assert ["--vdev", "net_tap0,iface=tb0"] in other["additional_params"]
+
+
 def test_write_config():
     """Test configuration writing to file."""
     config = TestConfigGenerator.generate_config(num_ports=1, num_threads=1, num_queues=1)
@@ -104,6 +139,22 @@ def test_write_config():
         os.unlink(temp_path)
 
 
+def test_write_config_pretty_env(tmp_path, monkeypatch):
+    """DPDK_TEST_PRETTY indents the output only for truthy values."""
+    config = TestConfigGenerator.generate_config(num_ports=1, num_threads=1, num_queues=1)
+    path = tmp_path / "config.json"
+    
+    for value, pretty in [("1", True), ("yes", True), ("0", False),
+                          ("false", False), ("", False)]:
+        monkeypatch.setenv("DPDK_TEST_PRETTY", value)
+        TestConfigGenerator.write_config(config, str(path))
+        assert ("\n" in path.read_text()) == pretty, f"DPDK_TEST_PRETTY={value!r}"
+    
+    monkeypatch.delenv("DPDK_TEST_PRETTY")
+    TestConfigGenerator.write_config(config, str(path))
+    assert "\n" not in path.read_text()
+
+
 def test_single_port_single_thread():
     """Test minimal configuration (1 port, 1 thread, 1 queue)."""
     config = TestConfigGenerator.generate_config(
@@ -0,0 +1,73 @@
+"""Unit tests for DpdkProcess output capture (bounded buffer and marker scan)."""
+
+from fixtures.dpdk_process import DpdkProcess
+
+
+def _capture(max_output_bytes=64):
+    """A DpdkProcess that is never started, fed synthetic stdout chunks."""
+    return DpdkProcess("unused", "unused", max_output_bytes=max_output_bytes)
+
+
+def test_marker_split_across_trim():
+    """A marker split across reads survives a trim between the two halves."""
+    process = _capture()
+    for i in range(10):
+        process._append_stdout(b"line %02d padding\n" % i)
+    
+    process._append_stdout(b"Control pl")
+    assert not process._startup_event.is_set()
+    process._append_stdout(b"ane ready\n")
+    
+    assert process._stdout_received > len(process._stdout_raw), "Output should have been trimmed"
+    assert process._startup_event.is_set()
+    assert process._ready
+
+
+def test_marker_in_overlong_unfinished_line():
+    """A marker in a line longer than the kept half is found before the trim."""
+    process = _capture()
+    process._append_stdout(b"y" * 50 + b"Control pl")
+    process._append_stdout(b"ane ready" + b"z" * 20)
+    
+    assert process._startup_event.is_set()
+    assert process._ready
+
+
+def test_no_newline_overflow_stays_bounded():
+    """Output without newlines is bounded and still scanned to the end."""
+    process = _capture()
+    for _ in range(20):
+        process._append_stdout(b"x" * 50)
+        assert len(process._stdout_raw) <= process.max_output_bytes
+        assert process._scan_from <= len(process._stdout_raw)
+    assert not process._startup_event.is_set()
+    
+    process._append_stdout(b"FAT")
+    process._append_stdout(b"AL" + b"x" * 50)
+    
+    assert process._startup_event.is_set()
+    assert process._init_error
+    assert not process._ready
+
+
+def test_final_scan_drains_unfinished_line():
+    """A last line without a newline is only scanned once output closes."""
+    process = _capture(max_output_bytes=4096)
+    process._append_stdout(b"EAL: Detected lcores\nControl plane ready")
+    assert not process._startup_event.is_set()
+    
+    process._scan_stdout(final=True)
+    
+    assert process._startup_event.is_set()
+    assert process._ready
+    assert process.get_stdout() == "EAL: Detected lcores\nControl plane ready"
+
+
+def test_trim_keeps_newest_half_of_long_last_line():
+    """A trim never empties the buffer when the newest line is overlong."""
+    process = _capture()
+    process._append_stdout(b"x" * 100 + b"Control plane ready\n")
+    
+    assert process._ready
+    assert process.get_stdout().endswith("Control plane ready")
+    assert len(process._stdout_raw) == process.max_output_bytes // 2
@@ -0,0 +1,58 @@
+"""Unit tests for TapInterfaceManager sysfs helpers."""
+
+import pytest
+from fixtures import tap_interface
+from fixtures.tap_interface import TapInterfaceManager
+
+
+@pytest.fixture
+def fake_sysfs(tmp_path, monkeypatch):
+    """Point the manager at a fake /sys/class/net; returns an add(name, ...) helper."""
+    monkeypatch.setattr(tap_interface, '_SYS_CLASS_NET', str(tmp_path))
+    
+    def add(name, operstate, flags, ifindex=1):
+        iface = tmp_path / name
+        iface.mkdir()
+        (iface / 'operstate').write_text(f"{operstate}\n")
+        (iface / 'flags').write_text(f"{flags}\n")
+        (iface / 'mtu').write_text("1500\n")
+        if ifindex is not None:
+            (iface / 'ifindex').write_text(f"{ifindex}\n")
+    
+    return add
+
+
+def test_get_operstate_normalized(fake_sysfs):
+    """get_operstate uses the same state values as get_interface_info."""
+    fake_sysfs('dtap0', 'up', '0x1003')
+    fake_sysfs('dtap1', 'down', '0x1002')
+    fake_sysfs('dtap2', 'lowerlayerdown', '0x1003')
+    fake_sysfs('dtap3', 'unknown', '0x1003')
+    
+    for name, expected in [('dtap0', 'UP'), ('dtap1', 'DOWN'),
+                           ('dtap2', 'UNKNOWN'), ('dtap3', 'UNKNOWN')]:
+        assert TapInterfaceManager.get_operstate(name) == expected
+        assert TapInterfaceManager.get_interface_info(name)['state'] == expected
+    
+    assert TapInterfaceManager.get_operstate('missing') is None
+
+
+def test_is_up_checks_iff_up(fake_sysfs):
+    """is_up follows IFF_UP, so a TAP reporting operstate unknown is up."""
+    fake_sysfs('dtap0', 'unknown', '0x1003')
+    fake_sysfs('dtap1', 'down', '0x1002')
+    
+    assert TapInterfaceManager.is_up('dtap0')
+    assert not TapInterfaceManager.is_up('dtap1')
+    assert not TapInterfaceManager.is_up('missing')
+
+
+def test_interface_vanishing_mid_read(fake_sysfs):
+    """An interface whose files disappear mid-read is reported as gone."""
+    fake_sysfs('dtap0', 'unknown', '0x1003', ifindex=5)
+    fake_sysfs('veth0', 'up', '0x1003', ifindex=None)  # ifindex already gone
+    
+    assert TapInterfaceManager.get_interface_info('veth0') is None
+    assert TapInterfaceManager.get_interface_info('dtap0') == {
+        'state': 'UNKNOWN', 'mtu': 1500, 'index': 5
+    }
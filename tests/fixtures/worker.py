@@ -0,0 +1,21 @@
+"""Per-worker resource names for running the suite under pytest-xdist.
+
+Every xdist worker exports PYTEST_XDIST_WORKER ("gw0", "gw1", ...), and
+concurrent DPDK processes need distinct control sockets, EAL file
+prefixes and TAP interface names. Outside xdist the historical
+single-process names are kept, so serial runs and tests that hard-code
+"dtap0" are unaffected.
+"""
+
+import os
+
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "")
+
+if WORKER_ID:
+    DEFAULT_SOCKET_PATH = f"/tmp/dpdk_control_{WORKER_ID}.sock"
+    DEFAULT_FILE_PREFIX = f"dpdk_test_{WORKER_ID}"
+    DEFAULT_TAP_PREFIX = f"dtap_{WORKER_ID}_"  # "dtap_gw12_3" fits IFNAMSIZ
+else:
+    DEFAULT_SOCKET_PATH = "/tmp/dpdk_control.sock"
+    DEFAULT_FILE_PREFIX = "dpdk_test"
+    DEFAULT_TAP_PREFIX = "dtap"
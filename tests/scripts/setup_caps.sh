@@ -0,0 +1,15 @@
+#!/usr/bin/env bash
+# Grant CAP_NET_ADMIN to the built binary so the e2e suite can create TAP
+# interfaces without sudo. Re-run after every rebuild of //:main.
+set -euo pipefail
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+PROJECT_ROOT="$(dirname "$(dirname "$SCRIPT_DIR")")"
+BINARY="$PROJECT_ROOT/bazel-bin/main"
+
+if [ ! -f "$BINARY" ]; then
+    echo "Binary not found: $BINARY. Run 'bazel build //:main' first." >&2
+    exit 1
+fi
+
+sudo setcap cap_net_admin+ep "$BINARY"
+getcap "$BINARY"
@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
-"""Debug test to see DPDK process output."""
+"""Manual debug script to see DPDK process output.
+
+Run from the project root: python tests/tools/debug_dpdk.py
+"""
 
 import sys
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from tests.fixtures.config_generator import TestConfigGenerator
 from tests.fixtures.dpdk_process import DpdkProcess
@@ -32,34 +35,30 @@ if not process.start():
 
 print("✓ Process started, waiting for ready...")
 
-# Wait for ready
-import time
-for i in range(10):
-    time.sleep(1)
-    stdout = process.get_stdout()
-    stderr = process.get_stderr()
-    
-    print(f"\n--- After {i+1} seconds ---")
-    print(f"Running: {process.is_running()}")
-    print(f"Stdout lines: {len(process.stdout_lines)}")
-    print(f"Stderr lines: {len(process.stderr_lines)}")
-    
-    if stdout:
-        print("\nSTDOUT:")
-        print(stdout)
-    
-    if stderr:
-        print("\nSTDERR:")
-        print(stderr)
-    
-    if "Control plane ready" in stdout:
-        print("\n✓ Control plane ready!")
-        break
-    
-    if not process.is_running():
-        print("\n✗ Process terminated!")
-        print(f"Exit code: {process.get_exit_code()}")
-        break
+# Wait for ready (returns as soon as the capture thread sees the marker)
+ready = process.wait_for_ready()
+stdout = process.get_stdout()
+stderr = process.get_stderr()
+
+print(f"\nRunning: {process.is_running()}")
+print(f"Stdout lines: {len(process.stdout_lines)}")
+print(f"Stderr lines: {len(process.stderr_lines)}")
+
+if stdout:
+    print("\nSTDOUT:")
+    print(stdout)
+
+if stderr:
+    print("\nSTDERR:")
+    print(stderr)
+
+if ready:
+    print("\n✓ Control plane ready!")
+elif not process.is_running():
+    print("\n✗ Process terminated!")
+    print(f"Exit code: {process.get_exit_code()}")
+else:
+    print(f"\n✗ {process.error_message}")
 
 # Cleanup
 if process.is_running():